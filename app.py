@@ -1,17 +1,121 @@
-import os
 import json
-from dotenv import load_dotenv
+import asyncio
+import time
+import zipfile
+from io import BytesIO
+from typing import List
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from utils.pdf_parser import extract_text_from_pdf
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from PyPDF2.errors import PdfReadError
+from config.config import get_settings
+from utils.pdf_parser import PDFLimitError, PDFTimeoutError
+from utils.prompt_builder import get_encoding, pack_jd, pack_prompt_inputs
+from utils.batch_jobs import BatchJob
+from utils.candidate_index import candidate_id, canonical_skills
+from utils.fast_analysis import build_fast_analysis
+from utils.json_stream import JSONObjectStream
+from utils.metrics import PAYLOAD_BYTES, REGISTRY, STAGE_SECONDS, Gauges, MetricsMiddleware, record_usage, stage
 from utils.rag import get_rag_examples
-from openai import OpenAI
+from utils.skill_matcher import get_skill_matcher
+from utils.resources import (
+    RESOURCES, aclose_resources, get_batch_jobs, get_llm_router, get_pdf_workers, get_rag_pool, get_result_cache,
+)
+from utils.result_cache import make_cache_key
+from utils.vector_store import get_candidate_index, get_collection
+
+# Settings (and .env) are read here, at import, because the limits below
+# come from them; they are not validated until startup. Clients, pools, the
+# vector store and the skill matcher are built lazily per worker process.
+settings = get_settings()
+
+# ===== Input and batch limits =====
+# PDF parsing stops once this much resume text is collected; the prompt
+# builder then packs the most relevant part of it into the token budget.
+RESUME_CHAR_BUDGET = 20000
+BATCH_CONCURRENCY = settings.batch_concurrency  # resumes in flight per batch job
+MAX_BATCH_RESUMES = settings.max_batch_resumes
+MAX_BATCH_BYTES = settings.max_batch_bytes  # uncompressed, across every upload and zip member
+MAX_SEARCH_RESULTS = 100
+
+# ===== Result cache: identical resume + JD pairs skip the whole pipeline =====
+ANALYSIS_MODEL = settings.analysis_model
+PROMPT_VERSION = 2  # bump whenever STRUCTURED_PROMPT or the prompt packing changes
+
+
+def prompt_key(settings):
+    """
+    The prompt part of every cache key: the token budgets are set per
+    deploy and change the prompt as much as a new PROMPT_VERSION does.
+    """
+    return f"{PROMPT_VERSION}:resume={settings.resume_token_budget}:jd={settings.jd_token_budget}"
+
+
+PROMPT_KEY = prompt_key(settings)
+
+background_tasks = set()  # fire-and-forget work (candidate indexing), kept referenced until done
+
+# Analyses in flight across all LLM providers; each provider also has its own limit.
+llm_semaphore = asyncio.Semaphore(settings.llm_concurrency)
+rag_semaphore = asyncio.Semaphore(settings.rag_concurrency)
+
+
+async def run_blocking(pool, semaphore, fn, *args):
+    """
+    Run a blocking call in `pool` without stalling the event loop.
+    The semaphore bounds how many calls of this stage are in flight at once.
+    """
+    async with semaphore:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, fn, *args)
 
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY)
 
-app = FastAPI()
+async def warm_up():
+    """
+    Build this worker's clients and pools before it takes traffic, so the
+    first request does not pay for them.
+    """
+    get_result_cache()
+    get_batch_jobs()
+    for provider in get_llm_router().providers:
+        try:
+            # Opens (and keeps alive) the TLS connection to each LLM API.
+            await asyncio.wait_for(provider.client.models.list(), 5)
+        except Exception as e:
+            print(f"LLM warm-up request to {provider.name} failed: {e!r}")
+    await get_pdf_workers().start()
+    # Opening Chroma and the embedding cache, loading the tokenizer and compiling the
+    # skill taxonomy all block.
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(get_rag_pool(), get_collection)
+    await loop.run_in_executor(get_rag_pool(), get_candidate_index)
+    await loop.run_in_executor(get_rag_pool(), get_encoding, ANALYSIS_MODEL)
+    await loop.run_in_executor(get_rag_pool(), get_skill_matcher)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    settings.require("openai_api_key")
+    if settings.warmup:
+        started = time.perf_counter()
+        await warm_up()
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage="warmup")
+    yield
+    if background_tasks:
+        await asyncio.wait(background_tasks, timeout=10)
+    await aclose_resources()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
+
+REGISTRY.register(Gauges("skillsync_result_cache", "Result cache counters.", "stat",
+                         lambda: get_result_cache().snapshot()))
+REGISTRY.register(Gauges("skillsync_llm_circuit_open", "1 while a provider's circuit breaker is open.", "provider",
+                         lambda: getattr(RESOURCES.peek("llm_router"), "circuit_states", dict)()))
+REGISTRY.register(Gauges("skillsync_embedding_cache", "Embedding cache and upstream call counters.", "stat",
+                         lambda: getattr(RESOURCES.peek("embedding_function"), "stats", {})))
 
 app.add_middleware(
     CORSMiddleware,
@@ -45,40 +149,436 @@ Job Description:
 
 @app.post("/analyze/")
 async def analyze(
+    resume: UploadFile = File(...),
+    jd_text: str = Form(...),
+    mode: str = Form("llm"),
+):
+    """
+    mode=llm (default) runs the full gpt-4o analysis; mode=fast returns the
+    same schema from the local rule-based engine in milliseconds.
+    """
+    if resume.content_type != "application/pdf":
+        raise HTTPException(status_code=400, detail="Please upload a PDF for the resume.")
+    if mode not in ("llm", "fast"):
+        raise HTTPException(status_code=400, detail="mode must be 'llm' or 'fast'.")
+    resume_bytes = await resume.read()
+    PAYLOAD_BYTES.observe(len(resume_bytes), kind="resume_pdf")
+    jd_text = jd_text.strip()
+
+    if mode == "fast":
+        return await run_fast_analysis(resume_bytes, jd_text)
+    return await analyze_cached(resume_bytes, jd_text)
+
+
+@app.post("/analyze/stream")
+async def analyze_stream(
     resume: UploadFile = File(...),
     jd_text: str = Form(...)
 ):
+    """
+    Same analysis as /analyze/, delivered as server-sent events: one event
+    per top-level section (skill_gap_analysis, improvement_suggestions,
+    summary, ...) as soon as it is complete, then a final `done` event.
+    """
     if resume.content_type != "application/pdf":
         raise HTTPException(status_code=400, detail="Please upload a PDF for the resume.")
     resume_bytes = await resume.read()
-    resume_text = extract_text_from_pdf(resume_bytes)
+    PAYLOAD_BYTES.observe(len(resume_bytes), kind="resume_pdf")
     jd_text = jd_text.strip()
+    key = make_cache_key(resume_bytes, jd_text, ANALYSIS_MODEL, PROMPT_KEY)
+    events = stream_analysis(resume_bytes, jd_text, key)
+    # Pull the first event here so PDF errors still surface as HTTP errors.
+    first = await anext(events)
+    async def body():
+        yield first
+        async for event in events:
+            yield event
+
+    return StreamingResponse(body(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@app.post("/analyze/batch")
+async def analyze_batch(
+    resumes: List[UploadFile] = File(...),
+    jd_text: str = Form(...),
+    stream: bool = Form(False),
+    mode: str = Form("llm"),
+):
+    """
+    Screen many resumes (PDFs and/or zips of PDFs) against one JD.
+    The job keeps running if the client disconnects; poll
+    GET /analyze/batch/{job_id} for progress and the ranked shortlist.
+    Polls must reach the worker running the job unless
+    BATCH_JOB_BACKEND=sqlite, which shares jobs between the workers on a
+    host and keeps finished ones across restarts.
+    With stream=true, results are also sent as NDJSON as each one finishes.
+    mode=fast screens the batch with the local engine instead of the LLM.
+    The reverse (one resume against many JDs) is not handled here; call
+    /analyze/ once per JD.
+    """
+    if mode not in ("llm", "fast"):
+        raise HTTPException(status_code=400, detail="mode must be 'llm' or 'fast'.")
+    files, batch_bytes = [], 0
+    too_many = HTTPException(status_code=400, detail=f"At most {MAX_BATCH_RESUMES} resumes per batch.")
+    too_large = HTTPException(status_code=413, detail=f"A batch may hold at most {MAX_BATCH_BYTES} bytes of PDFs.")
+    for upload in resumes:
+        is_zip = upload.content_type in ("application/zip", "application/x-zip-compressed") or \
+            (upload.filename or "").lower().endswith(".zip")
+        if not is_zip and upload.content_type != "application/pdf":
+            raise HTTPException(status_code=400, detail=f"{upload.filename}: upload PDFs or a zip of PDFs.")
+        # Never read more of an upload than the remaining budget allows.
+        limit = MAX_BATCH_BYTES - batch_bytes if is_zip else min(settings.max_pdf_bytes, MAX_BATCH_BYTES - batch_bytes)
+        data = await upload.read(limit + 1)
+        if not is_zip:
+            if len(files) >= MAX_BATCH_RESUMES:
+                raise too_many
+            if len(data) > settings.max_pdf_bytes:
+                raise HTTPException(status_code=413,
+                                    detail=f"{upload.filename} is larger than {settings.max_pdf_bytes} bytes.")
+            if len(data) > limit:
+                raise too_large
+            files.append((upload.filename, data))
+            batch_bytes += len(data)
+            continue
+        if len(data) > limit:
+            raise too_large
+        try:
+            with zipfile.ZipFile(BytesIO(data)) as archive:
+                # Check the central directory before decompressing anything.
+                members = [info for info in archive.infolist()
+                           if not info.is_dir() and info.filename.lower().endswith(".pdf")
+                           and not info.filename.startswith("__MACOSX/")]
+                if len(files) + len(members) > MAX_BATCH_RESUMES:
+                    raise too_many
+                for info in members:
+                    if info.file_size > settings.max_pdf_bytes:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"{info.filename} is larger than {settings.max_pdf_bytes} bytes.")
+                batch_bytes += sum(info.file_size for info in members)
+                if batch_bytes > MAX_BATCH_BYTES:
+                    raise too_large
+                # zipfile stops at each member's declared size, so the total above holds.
+                files += [(info.filename, archive.read(info)) for info in members]
+        except zipfile.BadZipFile:
+            raise HTTPException(status_code=400, detail=f"{upload.filename} is not a valid zip archive.")
+    if not files:
+        raise HTTPException(status_code=400, detail="No PDF resumes found in the upload.")
+
+    # JD work (normalizing, packing, skill extraction) is done once for the whole batch.
+    jd_text = jd_text.strip()
+    jd = pack_jd(jd_text, ANALYSIS_MODEL)
+    job = get_batch_jobs().add(BatchJob(len(files), jd_required_skills=jd.skills))
+    job.task = asyncio.create_task(run_batch(job, files, jd_text, mode, jd))
+
+    if not stream:
+        return job.progress()
+
+    async def ndjson():
+        yield json.dumps(job.progress()) + "\n"
+        async for item in job.events():
+            yield json.dumps(item) + "\n"
+        yield json.dumps({**job.progress(), "shortlist": summarize_shortlist(job)}) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@app.get("/analyze/batch/{job_id}")
+async def batch_status(job_id: str, limit: int = 20):
+    job = await get_batch_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown batch job.")
+    return {**job.progress(), "shortlist": summarize_shortlist(job, limit)}
+
+
+@app.get("/analyze/batch/{job_id}/results")
+async def batch_results(job_id: str):
+    job = await get_batch_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown batch job.")
+    return {**job.progress(), "results": job.shortlist() + [r for r in job.results if r["status"] != "ok"]}
+
+
+def summarize_shortlist(job, limit=None):
+    return [
+        {"filename": r["filename"], "overall_score": r["result"].get("overall_score"),
+         "missing_skills": r["result"].get("skill_gap_analysis", {}).get("missing_skills", []),
+         "summary": r["result"].get("summary")}
+        for r in job.shortlist(limit)
+    ]
+
+
+async def run_batch(job, files, jd_text, mode="llm", jd=None):
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def one(index, filename, resume_bytes):
+        async with semaphore:
+            try:
+                if mode == "fast":
+                    result = await run_fast_analysis(resume_bytes, jd_text, jd)
+                else:
+                    result = await analyze_cached(resume_bytes, jd_text, jd)
+                if "error" in result:
+                    item = {"index": index, "filename": filename, "status": "error", "error": result["error"]}
+                else:
+                    item = {"index": index, "filename": filename, "status": "ok", "result": result}
+            except Exception as e:
+                item = {"index": index, "filename": filename, "status": "error", "error": str(e)}
+        job.record(item)
+
+    try:
+        await asyncio.gather(*(one(i, name, data) for i, (name, data) in enumerate(files)))
+    finally:
+        job.finish()
 
-    prompt = STRUCTURED_PROMPT.format(
-        resume_text=resume_text[:3500],  # (truncated for token safety)
-        jd_text=jd_text[:2000]
-    )
 
-    response = client.chat.completions.create(
-        model="gpt-4o",  # Or another OpenAI model
-        messages=[
-            {"role": "system", "content": "You are an expert career advisor."},
-            {"role": "user", "content": prompt}
-        ],
-        temperature=0.2,
-        response_format={"type": "json_object"}
+async def analyze_cached(resume_bytes, jd_text, jd=None):
+    key = make_cache_key(resume_bytes, jd_text, ANALYSIS_MODEL, PROMPT_KEY)
+    return await get_result_cache().get_or_compute(
+        key,
+        lambda: run_analysis(resume_bytes, jd_text, jd),
+        should_cache=cacheable,
     )
-    ai_json = response.choices[0].message.content
+
+
+def cacheable(data):
+    """
+    Only clean answers from ANALYSIS_MODEL are cached: the key is built from
+    that model, so a failed-over provider's answer must not be served under it.
+    """
+    return "error" not in data and "fallback_reason" not in data and data.get("model") == ANALYSIS_MODEL
+
+
+@app.post("/search")
+async def search_candidates(
+    jd_text: str = Form(...),
+    top_n: int = Form(10),
+    must_have: str = Form(""),
+):
+    """
+    Previously analyzed candidates that best match a JD, without any LLM
+    call. must_have is a comma-separated list of skills every result must
+    list (aliases such as "k8s" are accepted). Must-have skills that no
+    indexed candidate holds are listed under `unknown_skills`.
+    """
+    if not 1 <= top_n <= MAX_SEARCH_RESULTS:
+        raise HTTPException(status_code=400, detail=f"top_n must be between 1 and {MAX_SEARCH_RESULTS}.")
+    skills = canonical_skills(skill for skill in must_have.split(",") if skill.strip())
+    index = get_candidate_index()
+    with stage("search"):
+        unknown = await run_blocking(get_rag_pool(), rag_semaphore, index.skills.unknown, skills)
+        results = [] if unknown else await run_blocking(get_rag_pool(), rag_semaphore, index.search,
+                                                        jd_text.strip(), top_n, skills)
+    return {"must_have": skills, "unknown_skills": unknown, "results": results}
+
+
+@app.get("/metrics")
+async def metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/cache/stats")
+async def cache_stats():
+    return get_result_cache().snapshot()
+
+
+async def extract_resume_text(resume_bytes, max_chars=RESUME_CHAR_BUDGET):
     try:
-        data = json.loads(ai_json)
-    except Exception:
-        data = {"error": "AI output could not be parsed. Output was:", "raw": ai_json}
+        with stage("pdf_extract"):
+            return await get_pdf_workers().extract(resume_bytes, max_chars=max_chars)
+    except PDFLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except PDFTimeoutError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except PdfReadError as e:
+        raise HTTPException(status_code=400, detail=f"Could not read the PDF: {e}")
 
-    # Optionally, augment with your RAG suggestions for missing_skills:
-    rag_examples = get_rag_examples(data.get("skill_gap_analysis", {}).get("missing_skills", []))
-    for suggestion in data.get("improvement_suggestions", []):
+
+def build_messages(resume_text, jd):
+    """
+    `jd` is the JD text, or a PackedJD when the caller already packed it.
+    """
+    with stage("prompt_pack"):
+        inputs = pack_prompt_inputs(resume_text, jd, ANALYSIS_MODEL)
+    prompt = STRUCTURED_PROMPT.format(resume_text=inputs.resume_text, jd_text=inputs.jd_text)
+    PAYLOAD_BYTES.observe(len(prompt.encode("utf-8")), kind="prompt")
+    return [
+        {"role": "system", "content": "You are an expert career advisor."},
+        {"role": "user", "content": prompt}
+    ]
+
+
+async def fetch_rag_examples(skill_gap):
+    missing_skills = (skill_gap or {}).get("missing_skills", [])
+    with stage("rag"):
+        return await run_blocking(get_rag_pool(), rag_semaphore, get_rag_examples, missing_skills)
+
+
+def attach_rag_examples(suggestions, rag_examples):
+    for suggestion in suggestions or []:
         skill = suggestion.get("skill")
         if skill in rag_examples and rag_examples[skill]:
             suggestion["rag_example"] = rag_examples[skill]
 
+
+async def fast_analysis(resume_text, jd_text, fallback_reason=None, jd=None):
+    with stage("fast_engine"):
+        data = build_fast_analysis(resume_text, jd_text, jd_skills=jd.skills if jd else None)
+    try:
+        # Example bullets need the embeddings API; the local engine must not wait on it.
+        rag_examples = await asyncio.wait_for(fetch_rag_examples(data["skill_gap_analysis"]),
+                                              settings.fast_rag_timeout)
+    except Exception as e:
+        print(f"Skipping RAG examples for the fast engine: {e!r}")
+        rag_examples = {}
+    attach_rag_examples(data["improvement_suggestions"], rag_examples)
+    if fallback_reason:
+        data["fallback_reason"] = fallback_reason
     return data
+
+
+async def run_fast_analysis(resume_bytes, jd_text, jd=None):
+    resume_text = await extract_resume_text(resume_bytes)
+    data = await fast_analysis(resume_text, jd_text, jd=jd)
+    index_candidate(resume_bytes, resume_text, data)
+    return data
+
+
+def index_candidate(resume_bytes, resume_text, data):
+    """
+    Add an analyzed resume to the /search index in the background, so the
+    response does not wait for the embedding call.
+    """
+    if not settings.index_candidates or "error" in data:
+        return
+
+    async def index():
+        try:
+            with stage("candidate_index"):
+                await run_blocking(get_rag_pool(), rag_semaphore, get_candidate_index().add,
+                                   candidate_id(resume_bytes), resume_text, data)
+        except Exception as e:
+            print(f"Indexing the candidate failed: {e!r}")
+
+    task = asyncio.create_task(index())
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+
+async def run_analysis(resume_bytes, jd_text, jd=None):
+    """
+    PDF -> LLM -> RAG enrichment for one resume/JD pair (uncached).
+    Falls back to the local engine if the LLM call fails or times out.
+    `jd` is the JD already packed by pack_jd(), when the caller has it.
+    """
+    resume_text = await extract_resume_text(resume_bytes)
+    messages = build_messages(resume_text, jd or jd_text)
+
+    try:
+        async with llm_semaphore:
+            with stage("llm"):
+                # Per-provider timeouts, retries, hedging and failover live in the router.
+                response, provider = await get_llm_router().chat(
+                    messages=messages,
+                    temperature=0.2,
+                    response_format={"type": "json_object"}
+                )
+    except Exception as e:
+        print(f"LLM analysis failed: {e!r}. Falling back to the fast engine.")
+        data = await fast_analysis(resume_text, jd_text, fallback_reason=type(e).__name__, jd=jd)
+        index_candidate(resume_bytes, resume_text, data)
+        return data
+    record_usage(provider.model, response.usage)
+    ai_json = response.choices[0].message.content
+    PAYLOAD_BYTES.observe(len(ai_json.encode("utf-8")), kind="completion")
+    try:
+        with stage("json_parse"):
+            data = json.loads(ai_json)
+    except Exception:
+        data = {"error": "AI output could not be parsed. Output was:", "raw": ai_json}
+    data["model"] = provider.model
+
+    # Optionally, augment with your RAG suggestions for missing_skills:
+    rag_examples = await fetch_rag_examples(data.get("skill_gap_analysis"))
+    attach_rag_examples(data.get("improvement_suggestions"), rag_examples)
+    index_candidate(resume_bytes, resume_text, data)
+    return data
+
+
+def sse_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_analysis(resume_bytes, jd_text, key):
+    """
+    Yield each top-level section of the analysis as an SSE event as soon as
+    the model has finished writing it. RAG lookups for the missing skills
+    start the moment `skill_gap_analysis` is complete, while the rest of
+    the answer is still being generated.
+    """
+    cached = await get_result_cache().get(key)
+    if cached is not None:
+        for section, value in cached.items():
+            if section != "model":
+                yield sse_event(section, value)
+        yield sse_event("done", {"cached": True, "model": cached.get("model")})
+        return
+
+    started = time.perf_counter()
+    resume_text = await extract_resume_text(resume_bytes)
+    messages = build_messages(resume_text, jd_text)
+    parser = JSONObjectStream()
+    data, rag_task, raw, parsed = {}, None, [], True
+    try:
+        async with llm_semaphore:
+            llm_started = time.perf_counter()
+            stream, provider = await get_llm_router().chat(
+                messages=messages,
+                temperature=0.2,
+                response_format={"type": "json_object"},
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            async with stream:
+                async for chunk in stream:
+                    record_usage(provider.model, getattr(chunk, "usage", None))
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    raw.append(delta)
+                    for section, value in parser.feed(delta):
+                        if not data:
+                            STAGE_SECONDS.observe(time.perf_counter() - llm_started, stage="llm_first_section")
+                        if section == "skill_gap_analysis":
+                            rag_task = asyncio.create_task(fetch_rag_examples(value))
+                        elif section == "improvement_suggestions" and rag_task is not None:
+                            attach_rag_examples(value, await rag_task)
+                        data[section] = value
+                        yield sse_event(section, value)
+            STAGE_SECONDS.observe(time.perf_counter() - llm_started, stage="llm_stream")
+    except json.JSONDecodeError:
+        parsed = False
+    except Exception as e:
+        if data:
+            yield sse_event("error", {"error": f"LLM stream failed: {e}"})
+            return
+        print(f"LLM analysis failed: {e!r}. Falling back to the fast engine.")
+        data = await fast_analysis(resume_text, jd_text, type(e).__name__)
+        index_candidate(resume_bytes, resume_text, data)
+        for section, value in data.items():
+            yield sse_event(section, value)
+        yield sse_event("done", {"cached": False})
+        return
+    finally:
+        if rag_task is not None and not rag_task.done():
+            rag_task.cancel()
+
+    if not (parsed and parser.done):
+        yield sse_event("error", {"error": "AI output could not be parsed. Output was:", "raw": "".join(raw)})
+        return
+    data["model"] = provider.model
+    if cacheable(data):
+        await get_result_cache().put(key, data, time.perf_counter() - started)
+    index_candidate(resume_bytes, resume_text, data)
+    yield sse_event("done", {"cached": False, "model": provider.model})
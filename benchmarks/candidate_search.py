@@ -0,0 +1,105 @@
+"""
+/search query latency and recall over a growing candidate index.
+
+Synthetic resumes (a random subset of SKILL_DB each) are indexed through
+CandidateIndex into a throwaway Chroma directory, using a local embedder
+whose vectors are the normalized sum of per-skill directions plus per-text
+noise, so skill overlap means cosine similarity. At each --sizes checkpoint
+it times JD searches with zero, one and two must-have skills and measures
+recall@top_n of the ANN results against an exact brute-force search over
+the same filtered set.
+
+    python -m benchmarks.candidate_search --sizes 10000,100000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+import chromadb  # noqa: E402
+from chromadb.api.types import EmbeddingFunction  # noqa: E402
+
+from benchmarks.common import hash_vector, percentile  # noqa: E402
+from utils.candidate_index import CandidateIndex, SkillIndex  # noqa: E402
+from utils.skill_matcher import SKILL_DB, get_skill_matcher  # noqa: E402
+
+
+class SkillTopicEmbeddingFunction(EmbeddingFunction):
+    def __init__(self, dim=128, noise=0.6):
+        self.dim, self.noise = dim, noise
+        self.directions = {skill: hash_vector(f"skill:{skill}", dim) for skill in SKILL_DB}
+
+    def __call__(self, input):
+        out = []
+        for text in input:
+            vec = self.noise * hash_vector(text, self.dim)
+            for skill in get_skill_matcher().extract(text):
+                vec = vec + self.directions.get(skill, 0)
+            out.append(vec / np.linalg.norm(vec))
+        return out
+
+
+def synthetic_resume(i, rng):
+    skills = rng.sample(SKILL_DB, rng.randint(3, 8))
+    return f"Candidate {i}\nSkills\n{', '.join(skills)}", skills
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    args = parser.parse_args()
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    rng = random.Random(0)
+    embed = SkillTopicEmbeddingFunction()
+    with tempfile.TemporaryDirectory() as tmp:
+        collection = chromadb.PersistentClient(path=os.path.join(tmp, "chroma")).get_or_create_collection(
+            "candidates", embedding_function=None, configuration={"hnsw": {"space": "cosine"}})
+        index = CandidateIndex(collection, SkillIndex(os.path.join(tmp, "skills.sqlite3")), embed)
+        vectors, skill_sets = [], []
+
+        indexed = 0
+        for size in sizes:
+            started = time.perf_counter()
+            while indexed < size:
+                batch = []
+                for i in range(indexed, min(size, indexed + args.batch_size)):
+                    text, skills = synthetic_resume(i, rng)
+                    batch.append((f"c{i}", text, {"overall_score": rng.randint(30, 95)}))
+                    skill_sets.append(set(skills))
+                vectors += embed([text for _, text, _ in batch])
+                index.add_many(batch)
+                indexed += len(batch)
+            print(f"indexed={indexed} (+{time.perf_counter() - started:.1f}s)")
+            matrix = np.vstack(vectors)
+
+            for must_count in (0, 1, 2):
+                latencies, recalls = [], []
+                for q in range(args.queries):
+                    required = rng.sample(SKILL_DB, 5)
+                    must_have = required[:must_count]
+                    jd = f"We are hiring someone with {', '.join(required)}."
+                    start = time.perf_counter()
+                    results = index.search(jd, args.top_n, must_have)
+                    latencies.append(time.perf_counter() - start)
+
+                    allowed = [i for i, skills in enumerate(skill_sets) if set(must_have) <= skills]
+                    if not allowed:
+                        continue
+                    scores = matrix[allowed] @ embed([jd])[0]
+                    exact = {f"c{allowed[i]}" for i in np.argsort(-scores)[:args.top_n]}
+                    recalls.append(len(exact & {r["candidate_id"] for r in results}) / len(exact))
+                print(f"  must_have={must_count}  p50={percentile(latencies, 50) * 1000:6.1f}ms "
+                      f"p99={percentile(latencies, 99) * 1000:6.1f}ms  "
+                      f"recall@{args.top_n}={sum(recalls) / max(1, len(recalls)):.3f}")
+
+
+if __name__ == "__main__":
+    main()
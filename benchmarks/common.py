@@ -0,0 +1,153 @@
+"""
+Shared helpers for the benchmark scripts: a dependency-free PDF writer,
+a tiny uvicorn launcher and latency summaries.
+"""
+import hashlib
+import os
+import socket
+import subprocess
+import sys
+import time
+import zlib
+
+import httpx
+import numpy as np
+from chromadb.api.types import EmbeddingFunction
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE_RESUME = """Jane Doe - Backend Developer
+Experience
+Developed RESTful APIs in Python and FastAPI serving 2M requests per day.
+Maintained PostgreSQL and SQL reporting pipelines for the finance team.
+Containerised services with Docker and deployed them on AWS.
+Skills
+python, sql, docker, aws, linux, communication, leadership
+"""
+
+SAMPLE_JD = (
+    "We are hiring a backend developer with strong python, sql, docker and "
+    "kubernetes experience. Exposure to graphql, ci/cd and security is a plus."
+)
+
+
+def _escape(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages, compress=False):
+    """
+    Build a minimal, valid PDF. `pages` is a list of strings, one per page.
+    With `compress`, content streams are Flate-encoded (a tiny file can then
+    expand to a very large page, which is how pathological inputs are built).
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page ids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for page_text in pages:
+        lines = page_text.splitlines() or [""]
+        ops = ["BT", "/F1 10 Tf", "12 TL", "40 800 Td"]
+        ops += [f"({_escape(line)}) Tj T*" for line in lines]
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1", "replace")
+        if compress:
+            stream = zlib.compress(stream, 9)
+            objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(stream), stream))
+        else:
+            objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids), len(kids)
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (i, obj)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for off in offsets:
+        out += b"%010d 00000 n \n" % off
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(app_path, port, env=None, cwd=ROOT, workers=1):
+    """
+    Launch `uvicorn <app_path>` in a subprocess and wait until it accepts requests.
+    """
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app_path, "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=cwd, env={**os.environ, **(env or {})},
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"{app_path} exited with code {proc.returncode}")
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/docs", timeout=0.5)
+            return proc
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"{app_path} did not start within 60s")
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def summarize(label, latencies, wall):
+    n = len(latencies)
+    print(
+        f"{label:<28} n={n:<5} rps={n / wall if wall else 0:8.1f}  "
+        f"p50={percentile(latencies, 50) * 1000:8.1f}ms  "
+        f"p99={percentile(latencies, 99) * 1000:8.1f}ms"
+    )
+
+
+
+class HashEmbeddingFunction(EmbeddingFunction):
+    """
+    Deterministic local embedder for benchmarks. Each call sleeps
+    `latency_s` to stand in for one embedding API round-trip, and `calls`
+    counts how many round-trips were made.
+    """
+
+    def __init__(self, dim=64, latency_s=0.0):
+        self.dim = dim
+        self.latency_s = latency_s
+        self.calls = 0
+
+    def __call__(self, input):
+        self.calls += 1
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        return [hash_vector(text, self.dim) for text in input]
+
+
+def hash_vector(text, dim=64):
+    """Unit vector seeded from the text's hash: same text, same vector."""
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+    vec = np.random.default_rng(seed).standard_normal(dim).astype(np.float32)
+    return vec / np.linalg.norm(vec)
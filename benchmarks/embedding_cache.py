@@ -0,0 +1,61 @@
+"""
+Upstream embedding calls and latency with and without CachedEmbeddingFunction.
+
+Replays a Zipf-distributed stream of skill gap lists (a few skills such as
+"python" show up in most requests) through a counting local embedder, then
+re-opens the SQLite tier to show that a restarted worker starts warm.
+
+    python -m benchmarks.embedding_cache
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.common import HashEmbeddingFunction
+from utils.embedding_cache import CachedEmbeddingFunction
+
+
+def replay(ef, requests):
+    start = time.perf_counter()
+    for skills in requests:
+        ef(skills)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--vocab", type=int, default=2000)
+    parser.add_argument("--gap-size", type=int, default=8)
+    parser.add_argument("--embed-latency-ms", type=float, default=20)
+    parser.add_argument("--memory-items", type=int, default=256)
+    parser.add_argument("--disk-items", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    requests = [
+        [f"skill-{min(int(r), args.vocab)}" for r in rng.zipf(1.3, args.gap_size)]
+        for _ in range(args.requests)
+    ]
+    latency = args.embed_latency_ms / 1000
+
+    raw = HashEmbeddingFunction(latency_s=latency)
+    print(f"{'uncached':<12} {replay(raw, requests):7.2f}s upstream_calls={raw.calls}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "embeddings.sqlite3")
+        for label in ("cold", "restarted"):
+            upstream = HashEmbeddingFunction(latency_s=latency)
+            cached = CachedEmbeddingFunction(upstream, "hash-64", path=path,
+                                             max_memory_items=args.memory_items,
+                                             max_disk_items=args.disk_items)
+            elapsed = replay(cached, requests)
+            print(f"{label:<12} {elapsed:7.2f}s upstream_calls={upstream.calls} "
+                  f"hit_ratio={cached.hit_ratio():.2f} stats={cached.stats}")
+
+
+if __name__ == "__main__":
+    main()
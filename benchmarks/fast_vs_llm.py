@@ -0,0 +1,127 @@
+"""
+Accuracy and latency of the local mode=fast engine against recorded LLM
+analyses.
+
+A recording is a JSONL file with one {"resume_text", "jd_text", "llm",
+"llm_latency_s"} object per line. Record one from a running API (real or
+stub-backed) over the bundled synthetic samples, or bring your own:
+
+    python -m benchmarks.fast_vs_llm --record recorded.jsonl --url http://127.0.0.1:8000
+    python -m benchmarks.fast_vs_llm recorded.jsonl
+"""
+import argparse
+import json
+import os
+import random
+import time
+
+import httpx
+
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+from utils.fast_analysis import build_fast_analysis  # noqa: E402
+from utils.skill_matcher import SKILL_DB, get_skill_matcher  # noqa: E402
+
+from benchmarks.common import make_pdf, percentile  # noqa: E402
+
+
+def synthetic_samples(n, seed=0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        required = rng.sample(SKILL_DB, 6)
+        known = rng.sample(required, rng.randint(1, 6)) + rng.sample(SKILL_DB, 3)
+        resume = "Experience\n" + "\n".join(
+            f"- Delivered a {rng.randint(5, 60)}% improvement using {skill}." for skill in known
+        ) + "\nEducation\nB.Sc.\nSkills\n" + ", ".join(known)
+        yield resume, f"We are looking for someone with {', '.join(required)}."
+
+
+# (resume text, skill, whether the skill is really there): misspellings the
+# fast engine should catch, and look-alike words it must not count.
+NEAR_MISSES = [
+    ("Ran kubernets clusters for 40 services.", "kubernetes", True),
+    ("Built the storefront in javascrpt and React.", "javascript", True),
+    ("Excels at communication with stakeholders.", "excel", False),
+    ("Managed wordpresses for three clients.", "wordpress", False),
+    ("Coordinated schedulings across two sites.", "scheduling", False),
+    ("Led the dockers' union negotiations.", "docker", False),
+]
+
+
+def check_near_misses():
+    wrong = []
+    for text, skill, expected in NEAR_MISSES:
+        present = skill in build_fast_analysis(text, f"Must know {skill}.")["skill_gap_analysis"]["present_skills"]
+        if present != expected:
+            wrong.append(f"{skill!r} in {text!r}: present={present}")
+    print(f"near-miss cases: {len(NEAR_MISSES) - len(wrong)}/{len(NEAR_MISSES)} correct")
+    for line in wrong:
+        print(f"  wrong: {line}")
+
+
+def record(path, url, n):
+    with httpx.Client(timeout=300) as http, open(path, "w") as out:
+        for resume_text, jd_text in synthetic_samples(n):
+            start = time.perf_counter()
+            resp = http.post(f"{url.rstrip('/')}/analyze/", data={"jd_text": jd_text},
+                             files={"resume": ("resume.pdf", make_pdf([resume_text]), "application/pdf")})
+            resp.raise_for_status()
+            out.write(json.dumps({"resume_text": resume_text, "jd_text": jd_text, "llm": resp.json(),
+                                  "llm_latency_s": time.perf_counter() - start}) + "\n")
+
+
+def canonical(skills):
+    out = set()
+    for skill in skills or []:
+        out.update(get_skill_matcher().extract(skill) or [" ".join(skill.lower().split())])
+    return out
+
+
+def prf(predicted, expected):
+    tp = len(predicted & expected)
+    precision = tp / len(predicted) if predicted else float(not expected)
+    recall = tp / len(expected) if expected else 1.0
+    return precision, recall
+
+
+def evaluate(path):
+    rows = [json.loads(line) for line in open(path) if line.strip()]
+    totals = {field: [0.0, 0.0] for field in ("required_skills", "present_skills", "missing_skills")}
+    score_errors, fast_latency, llm_latency = [], [], []
+    for row in rows:
+        start = time.perf_counter()
+        fast = build_fast_analysis(row["resume_text"], row["jd_text"])
+        fast_latency.append(time.perf_counter() - start)
+        llm_latency.append(row.get("llm_latency_s", 0.0))
+        for field, acc in totals.items():
+            p, r = prf(canonical(fast["skill_gap_analysis"][field]),
+                       canonical(row["llm"].get("skill_gap_analysis", {}).get(field)))
+            acc[0] += p
+            acc[1] += r
+        if isinstance(row["llm"].get("overall_score"), (int, float)):
+            score_errors.append(abs(fast["overall_score"] - row["llm"]["overall_score"]))
+
+    print(f"samples={len(rows)}")
+    for field, (p, r) in totals.items():
+        print(f"{field:<16} precision={p / len(rows):.2f} recall={r / len(rows):.2f}")
+    if score_errors:
+        print(f"overall_score    MAE={sum(score_errors) / len(score_errors):.1f}")
+    print(f"latency fast p50={percentile(fast_latency, 50) * 1000:.2f}ms p99={percentile(fast_latency, 99) * 1000:.2f}ms"
+          f" | llm p50={percentile(llm_latency, 50) * 1000:.0f}ms p99={percentile(llm_latency, 99) * 1000:.0f}ms")
+    check_near_misses()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", nargs="?")
+    parser.add_argument("--record", metavar="PATH", help="write a new recording to PATH")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--samples", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record, args.url, args.samples)
+    evaluate(args.record or args.recording)
+
+
+if __name__ == "__main__":
+    main()
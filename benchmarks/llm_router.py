@@ -0,0 +1,118 @@
+"""
+Tail latency and availability of LLM calls through utils.llm_router.
+
+Starts stub providers and drives the router in-process:
+  * "primary": --latency-ms, but --slow-rate of calls take --slow-ms and
+    --error-rate of them fail with a 503 (a provider with a bad tail);
+  * "secondary": a steady --secondary-latency-ms;
+  * "down": every call fails (a provider in an outage).
+
+Scenarios: the primary alone (timeout + retry only), primary with a hedged
+secondary, and an outage where the breaker should route around "down".
+
+    python -m benchmarks.llm_router --requests 400 --concurrency 16
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+from openai import AsyncOpenAI
+
+from benchmarks.common import free_port, percentile, start_server
+from utils.llm_router import LLM_CALLS, AllProvidersFailed, CircuitBreaker, LLMRouter, Provider
+
+MESSAGES = [{"role": "user", "content": "Analyze this resume against this job description."}]
+
+
+def provider(name, port, timeout, breaker_failures=5):
+    client = AsyncOpenAI(api_key="stub", base_url=f"http://127.0.0.1:{port}/v1", max_retries=0,
+                         http_client=httpx.AsyncClient(limits=httpx.Limits(max_connections=200)))
+    return Provider(name, client, "stub", timeout=timeout, concurrency=64, max_retries=1,
+                    breaker=CircuitBreaker(breaker_failures, reset_after=5.0))
+
+
+async def drive(router, requests, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, winners, failures = [], {}, 0
+
+    async def one():
+        nonlocal failures
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                _, winner = await router.chat(messages=MESSAGES, temperature=0.2)
+            except AllProvidersFailed:
+                failures += 1
+                return
+            latencies.append(time.perf_counter() - start)
+            winners[winner.name] = winners.get(winner.name, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies, winners, failures, time.perf_counter() - start
+
+
+def calls_to(name):
+    return sum(v for (p, _), v in LLM_CALLS._values.items() if p == name)
+
+
+async def scenario(label, router, args):
+    before = {p.name: calls_to(p.name) for p in router.providers}
+    latencies, winners, failures, wall = await drive(router, args.requests, args.concurrency)
+    calls = {p.name: calls_to(p.name) - before[p.name] for p in router.providers}
+    print(f"{label:<22} p50={percentile(latencies, 50) * 1000:7.0f}ms p95={percentile(latencies, 95) * 1000:7.0f}ms "
+          f"p99={percentile(latencies, 99) * 1000:7.0f}ms failed={failures:<4} wall={wall:5.1f}s "
+          f"answered_by={winners} provider_calls={calls}")
+    for p in router.providers:
+        await p.client.close()
+
+
+async def run(args, ports):
+    primary_port, secondary_port, down_port = ports
+    timeout = args.slow_ms / 1000 * 2
+    await scenario("primary only", LLMRouter([provider("primary", primary_port, timeout)], hedge=False), args)
+    await scenario("primary + hedge", LLMRouter([
+        provider("primary", primary_port, timeout),
+        provider("secondary", secondary_port, timeout),
+    ], hedge_delay=args.slow_ms / 1000), args)
+    await scenario("outage, with breaker", LLMRouter([
+        provider("down", down_port, timeout),
+        provider("secondary", secondary_port, timeout),
+    ], hedge_delay=args.slow_ms / 1000), args)
+    await scenario("outage, no breaker", LLMRouter([
+        provider("down", down_port, timeout, breaker_failures=10 ** 9),
+        provider("secondary", secondary_port, timeout),
+    ], hedge_delay=args.slow_ms / 1000), args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=int, default=200)
+    parser.add_argument("--slow-rate", type=float, default=0.05)
+    parser.add_argument("--slow-ms", type=int, default=2000)
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--secondary-latency-ms", type=int, default=300)
+    args = parser.parse_args()
+
+    ports = [free_port() for _ in range(3)]
+    envs = [
+        {"STUB_LATENCY_MS": str(args.latency_ms), "STUB_SLOW_RATE": str(args.slow_rate),
+         "STUB_SLOW_MS": str(args.slow_ms), "STUB_ERROR_RATE": str(args.error_rate)},
+        {"STUB_LATENCY_MS": str(args.secondary_latency_ms)},
+        {"STUB_LATENCY_MS": str(args.latency_ms), "STUB_ERROR_RATE": "1"},
+    ]
+    procs = []
+    try:
+        for port, env in zip(ports, envs):
+            procs.append(start_server("benchmarks.stub_llm:app", port, env=env))
+        asyncio.run(run(args, ports))
+    finally:
+        for proc in procs:
+            proc.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Load test for POST /analyze/ against a local stub LLM.
+
+Starts benchmarks.stub_llm and the API (from --app-dir, default this checkout),
+fires N concurrent PDF uploads per round and prints requests/sec with p50/p99
+latency. To compare before/after, point --app-dir at a second checkout:
+
+    git worktree add /tmp/skillsync-before <old-commit>
+    python -m benchmarks.load_test --app-dir /tmp/skillsync-before
+    python -m benchmarks.load_test
+"""
+import argparse
+import asyncio
+import os
+import time
+
+import httpx
+
+from benchmarks.common import ROOT, SAMPLE_JD, SAMPLE_RESUME, free_port, make_pdf, start_server, summarize
+
+
+async def fire(url, pdf, jd_text, concurrency, total):
+    latencies, errors = [], 0
+    sem = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(timeout=120, limits=limits) as http:
+        async def one():
+            nonlocal errors
+            async with sem:
+                start = time.perf_counter()
+                resp = await http.post(
+                    url,
+                    files={"resume": ("resume.pdf", pdf, "application/pdf")},
+                    data={"jd_text": jd_text},
+                )
+                latencies.append(time.perf_counter() - start)
+                if resp.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        return latencies, time.perf_counter() - start, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app-dir", default=ROOT, help="checkout to benchmark")
+    parser.add_argument("--url", help="benchmark an already running API instead")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--requests", type=int, default=128, help="uploads per round")
+    parser.add_argument("--latency-ms", type=int, default=300, help="stub LLM latency")
+    args = parser.parse_args()
+
+    procs = []
+    try:
+        url = args.url
+        if not url:
+            stub_port, api_port = free_port(), free_port()
+            procs.append(start_server("benchmarks.stub_llm:app", stub_port,
+                                      env={"STUB_LATENCY_MS": str(args.latency_ms)}))
+            env = {
+                "OPENAI_API_KEY": "stub",
+                "GROQ_API_KEY": "stub",  # still required by checkouts before the settings refactor
+                "LLM_PROVIDERS": "openai",
+                "OPENAI_BASE_URL": f"http://127.0.0.1:{stub_port}/v1",
+                "PYTHONPATH": os.path.abspath(args.app_dir),
+            }
+            procs.append(start_server("app:app", api_port, env=env, cwd=args.app_dir))
+            url = f"http://127.0.0.1:{api_port}/analyze/"
+
+        pdf = make_pdf([SAMPLE_RESUME] * 2)
+        print(f"target={url} stub_latency={args.latency_ms}ms")
+        for concurrency in args.concurrency:
+            latencies, wall, errors = asyncio.run(
+                fire(url, pdf, SAMPLE_JD, concurrency, args.requests)
+            )
+            summarize(f"concurrency={concurrency} err={errors}", latencies, wall)
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Cost of the tracing layer, to confirm it is cheap enough to leave on.
+
+Measures stage() with and without an active request trace, raw histogram
+and counter updates, rendering /metrics, and MetricsMiddleware around a
+trivial ASGI app compared with the bare app.
+
+    python -m benchmarks.metrics_overhead
+"""
+import argparse
+import asyncio
+import time
+
+from utils.metrics import REGISTRY, MetricsMiddleware, Counter, Histogram, _trace, stage
+
+
+def per_op(fn, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e9
+
+
+def noop_stage():
+    with stage("bench"):
+        pass
+
+
+async def bare_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def drive(app, n):
+    scope = {"type": "http", "path": "/", "method": "GET", "headers": []}
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(n):
+        await app(scope, receive, send)
+    return (time.perf_counter() - start) / n * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=200_000)
+    args = parser.parse_args()
+    n = args.n
+
+    histogram = Histogram("bench_seconds", "bench", ["stage"])
+    counter = Counter("bench_total", "bench", ["kind"])
+    print(f"histogram.observe           {per_op(lambda: histogram.observe(0.12, stage='x'), n):8.0f} ns/op")
+    print(f"counter.inc                 {per_op(lambda: counter.inc(3, kind='prompt'), n):8.0f} ns/op")
+    print(f"stage() without trace       {per_op(noop_stage, n):8.0f} ns/op")
+    token = _trace.set([])
+    print(f"stage() with trace          {per_op(noop_stage, n // 10):8.0f} ns/op")
+    _trace.reset(token)
+    print(f"render /metrics             {per_op(REGISTRY.render, 1000) / 1000:8.1f} us/op")
+
+    bare = asyncio.run(drive(bare_app, n // 10))
+    wrapped = asyncio.run(drive(MetricsMiddleware(bare_app), n // 10))
+    timed = asyncio.run(drive(MetricsMiddleware(bare_app, server_timing=True), n // 10))
+    print(f"ASGI request bare           {bare:8.0f} ns/op")
+    print(f"  + MetricsMiddleware       {wrapped:8.0f} ns/op (+{wrapped - bare:.0f})")
+    print(f"  + Server-Timing header    {timed:8.0f} ns/op (+{timed - bare:.0f})")
+
+
+if __name__ == "__main__":
+    main()
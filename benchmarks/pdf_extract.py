@@ -0,0 +1,113 @@
+"""
+Time and peak RSS of PDF text extraction over small, large and
+pathological generated PDFs: the original whole-document extractor vs.
+the page-bounded, early-stopping one (3,500 character budget, as used by
+/analyze/). Every measurement runs in a fresh process so peak RSS is
+attributable to that one file. Finally each file goes through
+PDFWorkerPool to show the per-file timeout bounding the pathological cases.
+
+    python -m benchmarks.pdf_extract
+"""
+import argparse
+import asyncio
+import multiprocessing
+import resource
+import time
+from io import BytesIO
+
+import PyPDF2
+
+from benchmarks.common import SAMPLE_RESUME, make_pdf
+from utils.pdf_parser import PDFWorkerPool, extract_text_from_pdf
+
+
+def legacy_extract(file_bytes):
+    """The original extractor: every page, concatenated with +=."""
+    pdf_reader = PyPDF2.PdfReader(BytesIO(file_bytes))
+    text = ""
+    for page in pdf_reader.pages:
+        page_text = page.extract_text()
+        if page_text:
+            text += page_text + "\n"
+    return text
+
+
+def bounded_extract(file_bytes):
+    return extract_text_from_pdf(file_bytes, max_chars=3500)
+
+
+def _measure(fn, file_bytes, conn):
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    try:
+        chars = len(fn(file_bytes))
+        error = None
+    except Exception as e:
+        chars, error = 0, type(e).__name__
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    conn.send((elapsed, before, peak, chars, error))
+
+
+def measure(fn, file_bytes, timeout):
+    parent, child = multiprocessing.Pipe()
+    proc = multiprocessing.get_context("fork").Process(target=_measure, args=(fn, file_bytes, child))
+    proc.start()
+    if not parent.poll(timeout):
+        proc.kill()
+        proc.join()
+        return None
+    result = parent.recv()
+    proc.join()
+    return result
+
+
+def corpus():
+    page = SAMPLE_RESUME * 6
+    # ~5 MB of text operators per page that compress to a few KB each.
+    bomb_page = ("Lorem ipsum dolor sit amet consectetur adipiscing elit " * 4 + "\n") * 20000
+    large = make_pdf([page] * 40)
+    return {
+        "small (1 page)": make_pdf([SAMPLE_RESUME]),
+        "large (40 pages)": large,
+        "huge (300 pages)": make_pdf([page] * 300),
+        "flate bomb (5 pages)": make_pdf([bomb_page] * 5, compress=True),
+        "truncated": large[: len(large) // 2],
+        "garbage": b"%PDF-1.4\n" + bytes(range(256)) * 400,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--pool-timeout", type=float, default=2)
+    args = parser.parse_args()
+
+    for name, file_bytes in corpus().items():
+        for label, fn in (("legacy", legacy_extract), ("bounded", bounded_extract)):
+            result = measure(fn, file_bytes, args.timeout)
+            if result is None:
+                print(f"{name:<22} {label:<8} timed out after {args.timeout}s")
+                continue
+            elapsed, before, peak, chars, error = result
+            print(f"{name:<22} {label:<8} size={len(file_bytes) / 1024:8.0f}KB  "
+                  f"time={elapsed * 1000:9.1f}ms  peak_rss={peak / 1024:7.1f}MB "
+                  f"(+{(peak - before) / 1024:6.1f}MB)  chars={chars}" + (f"  error={error}" if error else ""))
+    asyncio.run(through_pool(args.pool_timeout))
+
+
+async def through_pool(timeout):
+    pool = PDFWorkerPool(workers=1, timeout=timeout)
+    await pool.extract(make_pdf([SAMPLE_RESUME]))  # start the worker
+    for name, file_bytes in corpus().items():
+        start = time.perf_counter()
+        try:
+            outcome = f"chars={len(await pool.extract(file_bytes, max_chars=3500))}"
+        except Exception as e:
+            outcome = f"error={type(e).__name__}"
+        print(f"{name:<22} {'pool':<8} time={(time.perf_counter() - start) * 1000:9.1f}ms  {outcome}")
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
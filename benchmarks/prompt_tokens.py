@@ -0,0 +1,108 @@
+"""
+Input tokens sent per analysis: the old fixed character cut
+(resume[:3500] + jd[:2000]) against the token-budgeted prompt builder.
+
+Besides tokens, it reports how many of the JD's required skills that the
+resume does mention survive into the prompt ("skill recall"), a cheap proxy
+for whether the model still sees the evidence it needs.
+
+The corpus is synthetic by default (multi-page resumes with PDF-style noise:
+ragged whitespace, running headers, page numbers); pass a JSONL file with
+{"resume_text", "jd_text"} rows (e.g. a fast_vs_llm recording) to use real text:
+
+    python -m benchmarks.prompt_tokens
+    python -m benchmarks.prompt_tokens --corpus recorded.jsonl --resume-budget 600
+"""
+import argparse
+import json
+import os
+import random
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+from utils.prompt_builder import count_tokens, get_encoding, pack_prompt_inputs  # noqa: E402
+from utils.skill_matcher import SKILL_DB, get_skill_matcher  # noqa: E402
+
+from benchmarks.common import percentile  # noqa: E402
+
+FILLER = [
+    "Coordinated weekly stand-ups and stakeholder updates for {n} people.",
+    "Mentored {n} junior colleagues through onboarding.",
+    "Documented {n} internal processes in the team wiki.",
+    "Volunteered for the office social committee for {n} months.",
+    "Handled around {n} ad-hoc requests a week from other departments.",
+]
+
+
+def synthetic_samples(n, seed=0):
+    rng = random.Random(seed)
+    for i in range(n):
+        required = rng.sample(SKILL_DB, 6)
+        known = rng.sample(required, rng.randint(2, 6)) + rng.sample(SKILL_DB, 4)
+        lines = [f"Candidate {i}", "Senior Specialist", f"candidate{i}@example.com | +1 555 01{i % 100:02d}",
+                 "", "Summary", "Experienced professional with a track record of delivery.", "Experience"]
+        for job in range(rng.randint(4, 9)):
+            lines.append(f"Role {job}, Company {rng.randint(1, 99)} ({2024 - 3 * job - 3} - {2024 - 3 * job})")
+            for _ in range(rng.randint(4, 7)):
+                if rng.random() < 0.35:
+                    skill = rng.choice(known)
+                    lines.append(f"  •   Delivered a {rng.randint(5, 60)}% improvement   using {skill}.")
+                else:
+                    lines.append("  •   " + rng.choice(FILLER).format(n=rng.randint(2, 400)))
+            if job % 2:
+                lines += [f"Page {job // 2 + 1} of 3", f"Candidate {i}", "__________"]
+        lines += ["Education", "B.Sc., State University", "Skills", ", ".join(known[2:]), ", ".join(known[2:])]
+        jd = (f"About us: Company {i} is a fast-growing team that values ownership and curiosity. " * 3
+              + f"\nWe are looking for someone with {', '.join(required)}.\n"
+              + "We are an equal opportunity employer and value diversity. " * 4)
+        yield "\n".join(lines), jd
+
+
+def skill_recall(prompt_resume, resume_text, jd_text):
+    required = set(get_skill_matcher().extract(jd_text))
+    evidence = required & set(get_skill_matcher().extract(resume_text))
+    if not evidence:
+        return 1.0
+    return len(evidence & set(get_skill_matcher().extract(prompt_resume))) / len(evidence)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="JSONL with resume_text / jd_text rows")
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--model", default="gpt-4o")
+    parser.add_argument("--resume-budget", type=int, default=None)
+    parser.add_argument("--jd-budget", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.corpus:
+        rows = [json.loads(line) for line in open(args.corpus) if line.strip()]
+        samples = [(row["resume_text"], row["jd_text"]) for row in rows]
+    else:
+        samples = list(synthetic_samples(args.samples))
+
+    tokenizer = "tiktoken" if get_encoding(args.model) is not None else "estimate (1 token ~ 4 chars)"
+    legacy_tokens, packed_tokens, legacy_recall, packed_recall, pack_ms = [], [], [], [], []
+    for resume_text, jd_text in samples:
+        legacy_resume = resume_text[:3500]
+        legacy_tokens.append(count_tokens(legacy_resume, args.model) + count_tokens(jd_text[:2000], args.model))
+        legacy_recall.append(skill_recall(legacy_resume, resume_text, jd_text))
+
+        start = time.perf_counter()
+        inputs = pack_prompt_inputs(resume_text, jd_text, args.model, args.resume_budget, args.jd_budget)
+        pack_ms.append((time.perf_counter() - start) * 1000)
+        packed_tokens.append(inputs.resume_tokens + inputs.jd_tokens)
+        packed_recall.append(skill_recall(inputs.resume_text, resume_text, jd_text))
+
+    print(f"samples={len(samples)} model={args.model} tokenizer={tokenizer}")
+    for label, tokens, recall in (("fixed chars", legacy_tokens, legacy_recall),
+                                  ("token budget", packed_tokens, packed_recall)):
+        print(f"{label:<13} tokens mean={sum(tokens) / len(tokens):7.1f} p50={percentile(tokens, 50):5d} "
+              f"p99={percentile(tokens, 99):5d} | skill recall={sum(recall) / len(recall):.3f}")
+    saved = 1 - sum(packed_tokens) / sum(legacy_tokens)
+    print(f"input tokens saved: {saved:.1%} | packing p50={percentile(pack_ms, 50):.2f}ms "
+          f"p99={percentile(pack_ms, 99):.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
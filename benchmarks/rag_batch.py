@@ -0,0 +1,68 @@
+"""
+Serial per-skill RAG lookup vs. the batched `query_rag_examples` path.
+
+Uses an in-memory Chroma collection and a deterministic local embedder that
+sleeps --embed-latency-ms per call to model the embedding round-trip.
+
+    python -m benchmarks.rag_batch
+"""
+import argparse
+import os
+import time
+
+import chromadb
+
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+from utils.rag import query_rag_examples  # noqa: E402
+
+from benchmarks.common import HashEmbeddingFunction  # noqa: E402
+
+DOMAINS = ["it", "healthcare", "finance", "design", "logistics"]
+
+
+def serial_lookup(collection, skills):
+    """The original loop: one embedding call and one query per skill."""
+    results = {}
+    for skill in skills:
+        query = collection.query(query_texts=[skill], n_results=1)
+        bullets = query["documents"][0] if query["documents"] else []
+        if bullets:
+            results[skill] = bullets[0]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--gap-sizes", type=int, nargs="+", default=[1, 5, 15, 50])
+    parser.add_argument("--embed-latency-ms", type=float, default=30)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    ef = HashEmbeddingFunction(latency_s=args.embed_latency_ms / 1000)
+    collection = chromadb.EphemeralClient().get_or_create_collection("bench_bullets", embedding_function=ef)
+    for start in range(0, args.rows, 500):
+        ids = [str(i) for i in range(start, min(args.rows, start + 500))]
+        collection.add(
+            ids=ids,
+            documents=[f"Delivered project {i} using skill-{i % 300}" for i in map(int, ids)],
+            metadatas=[{"skill": f"skill-{i % 300}", "domain": DOMAINS[i % len(DOMAINS)], "role": "engineer"}
+                       for i in map(int, ids)],
+        )
+
+    print(f"rows={args.rows} embed_latency={args.embed_latency_ms}ms")
+    for size in args.gap_sizes:
+        skills = [f"skill-{i}" for i in range(size)]
+        for label, fn in (("serial", lambda: serial_lookup(collection, skills)),
+                          ("batched", lambda: query_rag_examples(skills, k=3, collection=collection))):
+            ef.calls = 0
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                fn()
+            elapsed = (time.perf_counter() - start) / args.repeat
+            print(f"gap={size:<4} {label:<8} {elapsed * 1000:8.1f}ms/lookup  "
+                  f"embed_calls={ef.calls // args.repeat}")
+
+
+if __name__ == "__main__":
+    main()
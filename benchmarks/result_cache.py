@@ -0,0 +1,77 @@
+"""
+/analyze/ result cache and single-flight behaviour against the stub LLM.
+
+Sends a burst of identical concurrent uploads (one upstream call expected),
+then sequential repeats (cache hits), then distinct resumes (misses), and
+prints latency per phase plus the cache snapshot from /cache/stats.
+
+    python -m benchmarks.result_cache
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.common import SAMPLE_JD, SAMPLE_RESUME, free_port, make_pdf, start_server, summarize
+
+
+async def post(http, pdf):
+    start = time.perf_counter()
+    resp = await http.post("/analyze/", files={"resume": ("resume.pdf", pdf, "application/pdf")},
+                           data={"jd_text": SAMPLE_JD})
+    resp.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def run(args):
+    from app import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://app", timeout=120) as http:
+        pdf = make_pdf([SAMPLE_RESUME])
+
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(post(http, pdf) for _ in range(args.burst)))
+        summarize("identical burst", latencies, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        latencies = [await post(http, pdf) for _ in range(args.repeats)]
+        summarize("sequential repeats", latencies, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        latencies = [await post(http, make_pdf([f"{SAMPLE_RESUME}\nRef {i}"])) for i in range(args.repeats)]
+        summarize("distinct resumes", latencies, time.perf_counter() - start)
+
+        print((await http.get("/cache/stats")).json())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--burst", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--backend", choices=["memory", "sqlite"], default="memory")
+    args = parser.parse_args()
+
+    port = free_port()
+    stub = start_server("benchmarks.stub_llm:app", port)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ.update({
+                "OPENAI_API_KEY": "stub", "LLM_PROVIDERS": "openai",
+                "OPENAI_BASE_URL": f"http://127.0.0.1:{port}/v1",
+                "CHROMA_PATH": os.path.join(tmp, "chroma"),
+                "EMBEDDING_CACHE_PATH": os.path.join(tmp, "embeddings.sqlite3"),
+                "RESULT_CACHE_BACKEND": args.backend,
+                "RESULT_CACHE_PATH": os.path.join(tmp, "results.sqlite3"),
+            })
+            asyncio.run(run(args))
+    finally:
+        stub.terminate()
+        stub.wait()
+
+
+if __name__ == "__main__":
+    main()
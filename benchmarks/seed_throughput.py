@@ -0,0 +1,59 @@
+"""
+Seeding throughput (rows/sec) for a large synthetic bullet corpus.
+
+Runs the incremental seeder three times against a temporary persistent
+Chroma store with a deterministic local embedder: a cold seed, an unchanged
+re-run (hash check only, no embedding) and a re-run after editing 1% of rows.
+
+    python -m benchmarks.seed_throughput --rows 100000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import chromadb
+
+from benchmarks.common import HashEmbeddingFunction
+from utils.seed_chromadb import iter_corpus, seed
+
+DOMAINS = ["it", "healthcare", "finance", "design", "logistics", "law", "education"]
+
+
+def write_corpus(path, rows, edited_every=0):
+    with open(path, "w") as f:
+        for i in range(rows):
+            skill = f"skill-{i % 5000}"
+            role = "senior engineer" if edited_every and i % edited_every == 0 else "engineer"
+            f.write(json.dumps({"bullet": f"Delivered initiative {i} applying {skill} at scale.",
+                                "skill": skill, "domain": DOMAINS[i % len(DOMAINS)], "role": role}) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = os.path.join(tmp, "bullets.jsonl")
+        ef = HashEmbeddingFunction()
+        collection = chromadb.PersistentClient(path=os.path.join(tmp, "chroma")).get_or_create_collection(
+            "bench_bullets", embedding_function=ef
+        )
+        write_corpus(corpus, args.rows)
+        runs = [("cold", None), ("unchanged", None), ("1% edited", 100)]
+        for label, edited_every in runs:
+            if edited_every:
+                write_corpus(corpus, args.rows, edited_every=edited_every)
+            ef.calls = 0
+            start = time.perf_counter()
+            stats = seed(iter_corpus(corpus), collection, batch_size=args.batch_size, source=label)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<10} {stats['rows'] / elapsed:10.0f} rows/s  {elapsed:7.1f}s  "
+                  f"upserted={stats['upserted']} skipped={stats['skipped']} embed_calls={ef.calls}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Per-skill regex loop vs. the precompiled SkillMatcher, across taxonomy sizes
+and resume lengths. Synthetic taxonomies mix one- and two-word terms. The matcher reports
+leftmost-longest matches, so a term nested inside a longer one ("learning"
+in "machine learning") is not reported separately.
+
+    python -m benchmarks.skill_matcher
+"""
+import argparse
+import os
+import random
+import re
+import tempfile
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+from utils.skill_matcher import SkillMatcher  # noqa: E402
+
+
+def legacy_extract(text, skills):
+    """The original fallback: one re.search per taxonomy entry."""
+    text = text.lower()
+    return list({skill for skill in skills if re.search(rf"\b{re.escape(skill)}\b", text)})
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--taxonomy-sizes", type=int, nargs="+", default=[50, 1000, 10000, 50000])
+    parser.add_argument("--resume-chars", type=int, nargs="+", default=[3500, 20000])
+    parser.add_argument("--legacy-max", type=int, default=10000, help="skip the slow loop above this size")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocab = ["".join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(80000)]
+
+    for size in args.taxonomy_sizes:
+        skills = list(dict.fromkeys(" ".join(rng.sample(vocab, rng.choice([1, 1, 2]))) for _ in range(size)))
+        build_s, matcher = timed(lambda: SkillMatcher.from_taxonomy(skills), 1)
+        with tempfile.NamedTemporaryFile(suffix=".json") as f:
+            matcher.save(f.name)
+            re.purge()  # measure a cold compile, as in a fresh worker
+            load_s, _ = timed(lambda: SkillMatcher.load(f.name), 1)
+        print(f"taxonomy={len(skills):<6} build={build_s * 1000:8.1f}ms load={load_s * 1000:8.1f}ms")
+        for chars in args.resume_chars:
+            words, length = [], 0
+            while length < chars:
+                word = rng.choice(skills) if rng.random() < 0.05 else rng.choice(vocab)
+                words.append(word)
+                length += len(word) + 1
+            text = " ".join(words)
+            new_s, found = timed(lambda: matcher.extract(text), args.repeat)
+            line = f"  resume={chars:<6} matcher={new_s * 1000:8.2f}ms"
+            if len(skills) <= args.legacy_max:
+                old_s, old_found = timed(lambda: legacy_extract(text, skills), args.repeat)
+                # The legacy loop also reports terms nested inside longer matches.
+                line += f"  legacy={old_s * 1000:9.2f}ms  legacy_found={len(old_found)}"
+            print(line + f"  skills_found={len(found)}")
+
+
+if __name__ == "__main__":
+    main()
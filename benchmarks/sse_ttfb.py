@@ -0,0 +1,76 @@
+"""
+Time to first meaningful byte: /analyze/ vs. /analyze/stream.
+
+Runs the API against the stub LLM, whose streamed answer is spread over
+--latency-ms like a real token stream. For each distinct resume it records
+when the first section event (skill_gap_analysis) arrives, when
+improvement_suggestions (with RAG examples) arrives, and when the response
+completes, next to the latency of the buffered /analyze/ call.
+
+    python -m benchmarks.sse_ttfb --latency-ms 4000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.common import SAMPLE_JD, SAMPLE_RESUME, free_port, make_pdf, percentile, start_server
+
+
+def timed_stream(http, url, pdf):
+    start = time.perf_counter()
+    marks = {}
+    files = {"resume": ("resume.pdf", pdf, "application/pdf")}
+    with http.stream("POST", url, files=files, data={"jd_text": SAMPLE_JD}) as resp:
+        resp.raise_for_status()
+        for line in resp.iter_lines():
+            if line.startswith("event: "):
+                marks.setdefault(line[len("event: "):], time.perf_counter() - start)
+    return marks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency-ms", type=int, default=4000)
+    parser.add_argument("--requests", type=int, default=5)
+    args = parser.parse_args()
+
+    stub_port, api_port = free_port(), free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        procs = [start_server("benchmarks.stub_llm:app", stub_port, env={"STUB_LATENCY_MS": str(args.latency_ms)})]
+        try:
+            procs.append(start_server("app:app", api_port, env={
+                "OPENAI_API_KEY": "stub", "LLM_PROVIDERS": "openai",
+                "OPENAI_BASE_URL": f"http://127.0.0.1:{stub_port}/v1",
+                "CHROMA_PATH": os.path.join(tmp, "chroma"),
+                "EMBEDDING_CACHE_PATH": os.path.join(tmp, "embeddings.sqlite3"),
+            }))
+            base = f"http://127.0.0.1:{api_port}"
+            buffered, first, suggestions, done = [], [], [], []
+            with httpx.Client(timeout=120) as http:
+                for i in range(args.requests):
+                    pdf = make_pdf([f"{SAMPLE_RESUME}\nbuffered {i}"])
+                    start = time.perf_counter()
+                    http.post(f"{base}/analyze/", files={"resume": ("r.pdf", pdf, "application/pdf")},
+                              data={"jd_text": SAMPLE_JD}).raise_for_status()
+                    buffered.append(time.perf_counter() - start)
+
+                    marks = timed_stream(http, f"{base}/analyze/stream", make_pdf([f"{SAMPLE_RESUME}\nstream {i}"]))
+                    first.append(marks["skill_gap_analysis"])
+                    suggestions.append(marks["improvement_suggestions"])
+                    done.append(marks["done"])
+
+            for label, values in (("/analyze/ (buffered)", buffered), ("stream: skill_gap_analysis", first),
+                                  ("stream: improvement_suggestions", suggestions), ("stream: done", done)):
+                print(f"{label:<34} p50={percentile(values, 50) * 1000:8.1f}ms  "
+                      f"max={max(values) * 1000:8.1f}ms")
+        finally:
+            for proc in procs:
+                proc.terminate()
+                proc.wait()
+
+
+if __name__ == "__main__":
+    main()
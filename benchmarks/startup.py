@@ -0,0 +1,76 @@
+"""
+Cold-start cost per worker: time to `import app`, time until a uvicorn
+worker accepts connections, and the latency of its first and second
+/analyze/ requests (against the stub LLM). Use --app-dir with a second
+checkout to compare against an older revision.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --app-dir /tmp/skillsync-before
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.common import ROOT, SAMPLE_JD, SAMPLE_RESUME, free_port, make_pdf, start_server
+
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import app; print(time.perf_counter() - t)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app-dir", default=ROOT)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    app_dir = os.path.abspath(args.app_dir)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stub_port = free_port()
+        stub = start_server("benchmarks.stub_llm:app", stub_port, env={"STUB_LATENCY_MS": "50"})
+        env = {
+            **os.environ,
+            "OPENAI_API_KEY": "stub", "LLM_PROVIDERS": "openai",
+            "OPENAI_BASE_URL": f"http://127.0.0.1:{stub_port}/v1",
+            "CHROMA_PATH": os.path.join(tmp, "chroma"),
+            "EMBEDDING_CACHE_PATH": os.path.join(tmp, "embeddings.sqlite3"),
+            "PYTHONPATH": app_dir,
+        }
+        try:
+            imports = [
+                float(subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], cwd=app_dir, env=env,
+                                     capture_output=True, text=True, check=True).stdout.split()[-1])
+                for _ in range(args.runs)
+            ]
+            print(f"import app            median={statistics.median(imports) * 1000:8.1f}ms")
+
+            ready, first, second = [], [], []
+            for i in range(args.runs):
+                port = free_port()
+                start = time.perf_counter()
+                proc = start_server("app:app", port, env=env, cwd=app_dir)
+                ready.append(time.perf_counter() - start)
+                try:
+                    with httpx.Client(timeout=120) as http:
+                        for bucket, tag in ((first, "first"), (second, "second")):
+                            pdf = make_pdf([f"{SAMPLE_RESUME}\n{tag} {i}"])
+                            t = time.perf_counter()
+                            http.post(f"http://127.0.0.1:{port}/analyze/", data={"jd_text": SAMPLE_JD},
+                                      files={"resume": ("r.pdf", pdf, "application/pdf")}).raise_for_status()
+                            bucket.append(time.perf_counter() - t)
+                finally:
+                    proc.terminate()
+                    proc.wait()
+            for label, values in (("worker ready", ready), ("first /analyze/", first), ("second /analyze/", second)):
+                print(f"{label:<21} median={statistics.median(values) * 1000:8.1f}ms")
+        finally:
+            stub.terminate()
+            stub.wait()
+
+
+if __name__ == "__main__":
+    main()
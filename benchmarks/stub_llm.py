@@ -0,0 +1,102 @@
+"""
+Local stand-in for the OpenAI API used by the benchmarks.
+
+Serves /v1/chat/completions (plain and streaming) and /v1/embeddings with an
+injectable delay, so load tests never touch the real API. Configure it with
+STUB_LATENCY_MS (default 300) and STUB_EMBED_DIM (default 64). To mimic a
+degraded provider, STUB_SLOW_RATE of chat calls take STUB_SLOW_MS instead
+and STUB_ERROR_RATE of them fail with a 503.
+
+    uvicorn benchmarks.stub_llm:app --port 9000
+"""
+import asyncio
+import json
+import os
+import random
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from benchmarks.common import hash_vector
+
+LATENCY = float(os.getenv("STUB_LATENCY_MS", "300")) / 1000
+EMBED_DIM = int(os.getenv("STUB_EMBED_DIM", "64"))
+SLOW_RATE = float(os.getenv("STUB_SLOW_RATE", "0"))
+SLOW_LATENCY = float(os.getenv("STUB_SLOW_MS", "3000")) / 1000
+ERROR_RATE = float(os.getenv("STUB_ERROR_RATE", "0"))
+
+CANNED_ANALYSIS = {
+    "skill_gap_analysis": {
+        "required_skills": ["python", "sql", "docker", "kubernetes", "graphql"],
+        "present_skills": ["python", "sql", "docker"],
+        "missing_skills": ["kubernetes", "graphql"],
+    },
+    "improvement_suggestions": [
+        {"skill": "kubernetes", "suggestion": "Mention any container orchestration work."},
+        {"skill": "graphql", "suggestion": "Add an API project that used GraphQL."},
+    ],
+    "formatting_feedback": "Clear structure; quantify more achievements.",
+    "overall_score": 72,
+    "summary": "Solid backend profile with a few infrastructure gaps.",
+    "personalized_roadmap": ["Deploy a side project on Kubernetes", "Build a GraphQL API"],
+}
+
+app = FastAPI()
+
+
+def _completion(content, usage):
+    return {
+        "id": "stub", "object": "chat.completion", "created": int(time.time()),
+        "model": "stub",
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": content}}],
+        "usage": usage,
+    }
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    if random.random() < ERROR_RATE:
+        await asyncio.sleep(LATENCY / 10)
+        return JSONResponse({"error": {"message": "stub overloaded", "type": "server_error"}}, status_code=503)
+    latency = SLOW_LATENCY if random.random() < SLOW_RATE else LATENCY
+    prompt_chars = sum(len(m.get("content") or "") for m in body.get("messages", []))
+    content = json.dumps(CANNED_ANALYSIS)
+    usage = {"prompt_tokens": prompt_chars // 4, "completion_tokens": len(content) // 4,
+             "total_tokens": (prompt_chars + len(content)) // 4}
+
+    if not body.get("stream"):
+        await asyncio.sleep(latency)
+        return _completion(content, usage)
+
+    async def events():
+        # Spread the latency over the chunks, like a real token stream.
+        pieces = [content[i:i + 16] for i in range(0, len(content), 16)]
+        for piece in pieces:
+            await asyncio.sleep(latency / len(pieces))
+            chunk = {"id": "stub", "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": "stub",
+                     "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}
+            yield f"data: {json.dumps(chunk)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.get("/v1/models")
+async def models():
+    return {"object": "list", "data": [{"id": "stub", "object": "model", "created": 0, "owned_by": "stub"}]}
+
+
+@app.post("/v1/embeddings")
+async def embeddings(request: Request):
+    body = await request.json()
+    texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+    await asyncio.sleep(LATENCY / 10)
+    return {
+        "object": "list", "model": body.get("model", "stub"),
+        "data": [{"object": "embedding", "index": i, "embedding": hash_vector(t, EMBED_DIM).tolist()} for i, t in enumerate(texts)],
+        "usage": {"prompt_tokens": 0, "total_tokens": 0},
+    }
@@ -1,14 +1,112 @@
 # config.py
 import os
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from dotenv import load_dotenv
 
-# 1. immediately load the .env file
-load_dotenv()
 
-# 2. now read the vars
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+def _env(name, default, cast=str):
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        raise ValueError(f"Invalid value for environment variable {name}: {value!r}") from None
 
-# 3. error out only if *either* is missing
-if not OPENAI_API_KEY or not GROQ_API_KEY:
-    raise EnvironmentError("Missing required environment variables")
+
+def _flag(value):
+    return value.lower() in ("1", "true", "yes")
+
+
+_CASTS = {int: int, float: float, bool: _flag}
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Every tunable the service reads from the environment / .env, in one place.
+    Missing values fall back to the defaults; call require() where a value
+    is needed. A value that does not parse (LLM_CONCURRENCY=abc) raises a
+    ValueError naming the variable.
+    """
+    openai_api_key: str = None
+    groq_api_key: str = None
+    analysis_model: str = "gpt-4o"
+    embedding_model: str = "text-embedding-ada-002"
+    embedding_cache_path: str = "cache/embeddings.sqlite3"
+    embedding_timeout: float = 10.0
+    embedding_max_retries: int = 1
+    # The local engine waits at most this long for RAG examples, then answers without them
+    fast_rag_timeout: float = 1.5
+    chroma_path: str = "chroma_db"
+    # Every analyzed resume is added to the candidate index behind /search
+    index_candidates: bool = True
+    candidate_skills_path: str = "chroma_db/candidate_skills.sqlite3"
+    # Per-stage concurrency limits
+    llm_concurrency: int = 32
+    pdf_concurrency: int = 2
+    rag_concurrency: int = 4
+    http_max_connections: int = 100
+    # LLM providers, tried in this order (any without an API key is skipped)
+    llm_providers: str = "openai,groq"
+    openai_base_url: str = None
+    openai_concurrency: int = 32
+    llm_timeout: float = 60.0
+    groq_base_url: str = "https://api.groq.com/openai/v1"
+    groq_model: str = "llama-3.3-70b-versatile"
+    groq_concurrency: int = 16
+    groq_timeout: float = 30.0
+    llm_max_retries: int = 1
+    # Race the next provider once the current one is slower than its p95
+    # (LLM_HEDGE_DELAY seconds until there are enough samples)
+    llm_hedge: bool = True
+    llm_hedge_delay: float = 10.0
+    llm_breaker_failures: int = 5
+    llm_breaker_reset: float = 30.0
+    batch_concurrency: int = 8
+    max_batch_resumes: int = 500
+    # Uncompressed PDF bytes held in memory for one batch job (zip members included)
+    max_batch_bytes: int = 200 * 1024 * 1024
+    # Batch job progress: "memory" is only visible to the worker running the job
+    # (run one worker or route polls stickily); "sqlite" is shared by the workers on a host
+    batch_job_backend: str = "memory"
+    batch_job_path: str = "cache/batch_jobs.sqlite3"
+    # PDF limits
+    max_pdf_bytes: int = 10 * 1024 * 1024
+    max_pdf_pages: int = 20
+    pdf_timeout: float = 10.0
+    # Result cache
+    result_cache_backend: str = "memory"  # "memory" or "sqlite"
+    result_cache_path: str = "cache/results.sqlite3"
+    result_cache_ttl: float = 86400.0
+    result_cache_max_entries: int = 1000
+    # Prompt packing: tokens of resume / JD text sent to the LLM per analysis
+    resume_token_budget: int = 600
+    jd_token_budget: int = 300
+    # Rule-based matcher: a file written by SkillMatcher.save(), else the built-in SKILL_DB
+    skill_taxonomy_path: str = None
+    # Observability and startup
+    server_timing: bool = False
+    warmup: bool = True
+
+    @classmethod
+    def from_env(cls):
+        return cls(**{
+            field.name: _env(field.name.upper(), field.default, _CASTS.get(field.type, str))
+            for field in fields(cls)
+        })
+
+    def require(self, *names):
+        missing = [name.upper() for name in names if not getattr(self, name)]
+        if missing:
+            raise EnvironmentError(f"Missing required environment variables: {', '.join(missing)}")
+        return self
+
+
+@lru_cache(maxsize=None)
+def get_settings():
+    # .env is read once, the first time settings are needed (app.py does so at
+    # import; the library modules only when a call needs a setting).
+    load_dotenv()
+    return Settings.from_env()
@@ -0,0 +1,67 @@
+"""
+Upload limits of /analyze/batch; nothing here reaches the analysis itself.
+"""
+import dataclasses
+import io
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+
+def make_zip(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members:
+            archive.writestr(name, data)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, "settings", dataclasses.replace(app_module.settings, max_pdf_bytes=1000))
+    monkeypatch.setattr(app_module, "MAX_BATCH_RESUMES", 3)
+    monkeypatch.setattr(app_module, "MAX_BATCH_BYTES", 2500)
+    return TestClient(app_module.app)
+
+
+def post(client, *uploads):
+    return client.post("/analyze/batch", files=[("resumes", upload) for upload in uploads], data={"jd_text": "python"})
+
+
+def test_zip_member_over_the_pdf_limit(client):
+    resp = post(client, ("a.zip", make_zip([("big.pdf", b"0" * 10 ** 6)]), "application/zip"))
+    assert resp.status_code == 413
+    assert "big.pdf" in resp.json()["detail"]
+
+
+def test_zip_with_too_many_members(client):
+    resp = post(client, ("a.zip", make_zip([(f"{i}.pdf", b"x") for i in range(4)]), "application/zip"))
+    assert resp.status_code == 400
+
+
+def test_zip_members_over_the_batch_limit_in_total(client):
+    # Each member is under the per-PDF limit; together they are not.
+    resp = post(client, ("a.zip", make_zip([(f"{i}.pdf", b"0" * 900) for i in range(3)]), "application/zip"))
+    assert resp.status_code == 413
+    assert "2500 bytes" in resp.json()["detail"]
+
+
+def test_batch_limit_spans_uploads(client):
+    resp = post(client,
+                ("a.pdf", b"0" * 900, "application/pdf"),
+                ("b.zip", make_zip([("b.pdf", b"0" * 900), ("c.pdf", b"0" * 900)]), "application/zip"))
+    assert resp.status_code == 413
+
+
+def test_plain_pdf_over_the_pdf_limit(client):
+    resp = post(client, ("big.pdf", b"0" * 1001, "application/pdf"))
+    assert resp.status_code == 413
+    assert "big.pdf" in resp.json()["detail"]
+
+
+def test_other_file_types_are_rejected(client):
+    resp = post(client, ("notes.txt", b"hello", "text/plain"))
+    assert resp.status_code == 400
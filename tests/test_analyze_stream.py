@@ -0,0 +1,94 @@
+"""
+/analyze/stream end to end against benchmarks.stub_llm, served in-process
+as a fake OpenAI streaming endpoint.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+import app as app_module
+from benchmarks import stub_llm
+from utils.llm_router import LLMRouter, Provider
+from utils.result_cache import MemoryBackend, ResultCache
+
+RESUME_TEXT = "Jane Doe\nSkills\npython, sql, docker"
+RAG_EXAMPLE = "Ran 40 services on Kubernetes with zero-downtime deploys."
+
+
+def parse_sse(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    monkeypatch.setattr(stub_llm, "LATENCY", 0.05)
+    monkeypatch.setattr(stub_llm, "ERROR_RATE", 0)
+    cache = ResultCache(MemoryBackend())
+    provider = Provider("stub", AsyncOpenAI(
+        api_key="stub", base_url="http://stub/v1", max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=stub_llm.app)),
+    ), app_module.ANALYSIS_MODEL, timeout=5, max_retries=0)
+
+    async def extract_resume_text(resume_bytes, max_chars=None):
+        return RESUME_TEXT
+
+    async def fetch_rag_examples(skill_gap):
+        return {skill: RAG_EXAMPLE for skill in skill_gap["missing_skills"]}
+
+    monkeypatch.setattr(app_module, "get_llm_router", lambda: LLMRouter([provider], hedge=False))
+    monkeypatch.setattr(app_module, "get_result_cache", lambda: cache)
+    monkeypatch.setattr(app_module, "extract_resume_text", extract_resume_text)
+    monkeypatch.setattr(app_module, "fetch_rag_examples", fetch_rag_examples)
+    monkeypatch.setattr(app_module, "index_candidate", lambda *args: None)
+    return cache
+
+
+def post_stream(resume=b"%PDF-1.4 resume"):
+    async def run():
+        transport = httpx.ASGITransport(app=app_module.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://app") as http:
+            resp = await http.post("/analyze/stream", data={"jd_text": "python and kubernetes"},
+                                   files={"resume": ("resume.pdf", resume, "application/pdf")})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        return parse_sse(resp.text)
+
+    return asyncio.run(run())
+
+
+def test_sections_stream_in_order_then_done(stub):
+    events = post_stream()
+
+    assert [event for event, _ in events] == [*stub_llm.CANNED_ANALYSIS, "done"]
+    sections = dict(events[:-1])
+    assert sections["skill_gap_analysis"] == stub_llm.CANNED_ANALYSIS["skill_gap_analysis"]
+    suggestions = {s["skill"]: s for s in sections["improvement_suggestions"]}
+    assert suggestions["kubernetes"]["rag_example"] == RAG_EXAMPLE
+    assert events[-1] == ("done", {"cached": False, "model": app_module.ANALYSIS_MODEL})
+
+
+def test_repeat_is_replayed_from_the_cache(stub):
+    first = post_stream()
+    second = post_stream()
+
+    assert second[:-1] == first[:-1]
+    assert second[-1] == ("done", {"cached": True, "model": app_module.ANALYSIS_MODEL})
+    assert stub.stats["hits"] == 1
+
+
+def test_provider_failure_falls_back_to_the_fast_engine(stub, monkeypatch):
+    monkeypatch.setattr(stub_llm, "ERROR_RATE", 1)
+    events = post_stream()
+
+    sections = dict(events[:-1])
+    assert sections["fallback_reason"] == "AllProvidersFailed"
+    assert "skill_gap_analysis" in sections
+    assert events[-1] == ("done", {"cached": False})
+    assert stub.snapshot()["entries"] == 0
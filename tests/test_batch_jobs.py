@@ -0,0 +1,63 @@
+import asyncio
+
+from utils.batch_jobs import BatchJob, JobStore
+
+
+def ok(index, score):
+    return {"index": index, "filename": f"{index}.pdf", "status": "ok", "result": {"overall_score": score}}
+
+
+def test_memory_store_only_knows_its_own_jobs():
+    job = JobStore().add(BatchJob(1))
+    assert asyncio.run(JobStore().get(job.id)) is None
+
+
+def test_sqlite_store_shares_progress_between_workers(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    running_here, other_worker = JobStore(path=path), JobStore(path=path)
+
+    job = running_here.add(BatchJob(3, jd_required_skills=["python"]))
+    job.record(ok(0, 40))
+    job.record(ok(1, 90))
+    running_here._executor.submit(lambda: None).result()  # wait for queued writes
+
+    seen = asyncio.run(other_worker.get(job.id))
+    assert seen.progress()["status"] == "running"
+    assert (seen.completed, seen.failed, seen.jd_required_skills) == (2, 0, ["python"])
+    assert [r["filename"] for r in seen.shortlist()] == ["1.pdf", "0.pdf"]
+
+    job.record({"index": 2, "filename": "2.pdf", "status": "error", "error": "bad pdf"})
+    job.finish()
+    running_here.close()
+    seen = asyncio.run(other_worker.get(job.id))
+    assert (seen.status, seen.completed, seen.failed) == ("done", 2, 1)
+    assert seen.finished_at == job.finished_at
+
+
+def test_finished_jobs_survive_a_restart_and_unfinished_ones_are_interrupted(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    store = JobStore(path=path)
+    done, unfinished = store.add(BatchJob(1)), store.add(BatchJob(2))
+    done.record(ok(0, 70))
+    done.finish()
+    unfinished.record(ok(0, 50))
+    store.close()
+    unfinished.finish()  # the batch task's own finish() after shutdown is a no-op
+
+    restarted = JobStore(path=path)
+    assert asyncio.run(restarted.get(done.id)).status == "done"
+    assert asyncio.run(restarted.get(unfinished.id)).progress()["status"] == "interrupted"
+    assert asyncio.run(restarted.get("missing")) is None
+
+
+def test_only_max_jobs_finished_jobs_are_kept(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    store = JobStore(max_jobs=2, path=path)
+    jobs = [store.add(BatchJob(1)) for _ in range(4)]
+    for job in jobs:
+        job.finish()
+    store.close()
+
+    reopened = JobStore(path=path)
+    kept = [job.id for job in jobs if asyncio.run(reopened.get(job.id)) is not None]
+    assert len(kept) == 2
@@ -0,0 +1,62 @@
+import uuid
+
+import chromadb
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+from utils.candidate_index import CandidateIndex, SkillIndex
+
+
+def embed(texts):
+    # Bag of characters: close enough for ranking a handful of resumes.
+    out = []
+    for text in texts:
+        vec = np.zeros(64, dtype=np.float32)
+        for ch in text.lower():
+            vec[ord(ch) % 64] += 1
+        out.append(vec / (np.linalg.norm(vec) or 1))
+    return out
+
+
+@pytest.fixture
+def index(tmp_path):
+    collection = chromadb.EphemeralClient().get_or_create_collection(
+        f"candidates-{uuid.uuid4().hex}", embedding_function=None, configuration={"hnsw": {"space": "cosine"}})
+    index = CandidateIndex(collection, SkillIndex(str(tmp_path / "skills.sqlite3")), embed)
+    index.add_many([
+        ("py", "Ada\nBackend engineer\nPython, SQL and Docker", {"overall_score": 80}),
+        # "Java" and "Spring Boot" are outside the built-in taxonomy; the analysis found them.
+        ("jvm", "Grace\nBackend engineer\nJava services on Spring Boot, some k8s",
+         {"overall_score": 70, "skill_gap_analysis": {"present_skills": ["Java", "Spring Boot", None]}}),
+    ])
+    return index
+
+
+def test_analysis_skills_are_indexed_with_taxonomy_matches(index):
+    assert set(index.skills.candidates_with(["java", "spring boot", "kubernetes"])) == {"jvm"}
+    assert index.skills.candidates_with(["python", "docker"]) == ["py"]
+
+
+def test_must_have_filters_on_analysis_skills(index):
+    results = index.search("Java backend engineer", top_n=5, must_have=["Java"])
+    assert [r["candidate_id"] for r in results] == ["jvm"]
+    assert results[0]["last_score"] == 70
+
+
+def test_unknown_skills_are_reported(index):
+    assert index.skills.unknown(["java", "rust", "python"]) == ["rust"]
+
+
+def test_search_endpoint_reports_unknown_must_haves(index, monkeypatch):
+    monkeypatch.setattr(app_module, "get_candidate_index", lambda: index)
+    client = TestClient(app_module.app)
+
+    resp = client.post("/search", data={"jd_text": "backend engineer", "must_have": "java, rust"})
+    assert resp.json() == {"must_have": ["java", "rust"], "unknown_skills": ["rust"], "results": []}
+
+    resp = client.post("/search", data={"jd_text": "backend engineer", "must_have": "k8s"})
+    body = resp.json()
+    assert body["unknown_skills"] == []
+    assert [r["candidate_id"] for r in body["results"]] == ["jvm"]
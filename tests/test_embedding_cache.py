@@ -0,0 +1,122 @@
+import numpy as np
+
+from utils.embedding_cache import CachedEmbeddingFunction
+
+
+class CountingEmbedder:
+    """
+    Stands in for the OpenAI embedding function: a deterministic vector per
+    text, with every upstream call and text recorded.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input):
+        self.calls.append(list(input))
+        return [np.full(4, float(len(text)), dtype=np.float32) for text in input]
+
+
+def test_repeated_texts_are_embedded_once():
+    upstream = CountingEmbedder()
+    cache = CachedEmbeddingFunction(upstream, "model")
+
+    first = cache(["python", "docker", "python"])
+    second = cache(["docker", "python"])
+
+    assert upstream.calls == [["python", "docker"]]
+    np.testing.assert_array_equal(first[0], second[1])
+    assert cache.stats["upstream_calls"] == 1
+    assert cache.stats["misses"] == 2
+    assert cache.stats["memory_hits"] == 2
+    assert cache.hit_ratio() == 0.5
+
+
+def test_only_missing_texts_go_upstream_in_one_batch():
+    upstream = CountingEmbedder()
+    cache = CachedEmbeddingFunction(upstream, "model")
+    cache(["a", "b"])
+
+    vectors = cache(["a", "ccc", "b", "dd"])
+
+    assert upstream.calls[-1] == ["ccc", "dd"]
+    assert [v[0] for v in vectors] == [1.0, 3.0, 1.0, 2.0]
+
+
+def test_keys_include_the_model_name():
+    upstream = CountingEmbedder()
+    CachedEmbeddingFunction(upstream, "small")(["text"])
+    CachedEmbeddingFunction(upstream, "large")(["text"])
+
+    assert len(upstream.calls) == 2
+
+
+def test_memory_tier_evicts_least_recently_used():
+    upstream = CountingEmbedder()
+    cache = CachedEmbeddingFunction(upstream, "model", max_memory_items=2)
+    cache(["a"])
+    cache(["b"])
+    cache(["a"])  # "b" is now the least recently used
+    cache(["c"])
+
+    cache(["a"])
+    assert len(upstream.calls) == 3
+    cache(["b"])
+    assert upstream.calls[-1] == ["b"]
+
+
+def test_disk_tier_survives_a_new_instance(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite3")
+    upstream = CountingEmbedder()
+    CachedEmbeddingFunction(upstream, "model", path=path)(["python", "sql"])
+
+    restarted = CachedEmbeddingFunction(upstream, "model", path=path)
+    vectors = restarted(["sql", "python"])
+
+    assert len(upstream.calls) == 1
+    assert restarted.stats["disk_hits"] == 2
+    assert restarted.stats["upstream_calls"] == 0
+    assert [v[0] for v in vectors] == [3.0, 6.0]
+
+
+def test_disk_tier_evicts_oldest_rows_and_counts_them(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite3")
+    upstream = CountingEmbedder()
+    cache = CachedEmbeddingFunction(upstream, "model", path=path, max_memory_items=1, max_disk_items=2)
+    cache(["a", "b"])
+    cache(["c"])
+
+    assert cache.stats["evictions"] == 1
+    (rows,) = cache._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+    assert rows == 2
+
+
+def test_disk_row_count_is_tracked_without_rescanning(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite3")
+    cache = CachedEmbeddingFunction(CountingEmbedder(), "model", path=path, max_memory_items=1, max_disk_items=3)
+    cache(["a", "b"])
+    cache(["c", "d", "e"])
+    assert cache._disk_count == 3
+    assert cache.stats["evictions"] == 2
+
+    reopened = CachedEmbeddingFunction(CountingEmbedder(), "model", path=path, max_disk_items=3)
+    assert reopened._disk_count == 3
+
+
+def test_collection_config_round_trip(tmp_path, monkeypatch):
+    from chromadb.utils.embedding_functions import OpenAIEmbeddingFunction
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    upstream = OpenAIEmbeddingFunction(api_key_env_var="OPENAI_API_KEY", model_name="text-embedding-3-small")
+    cache = CachedEmbeddingFunction(upstream, "text-embedding-3-small", path=str(tmp_path / "e.sqlite3"))
+
+    assert CachedEmbeddingFunction.name() == "skillsync_cached"
+    assert not cache.is_legacy()
+    rebuilt = CachedEmbeddingFunction.build_from_config(cache.get_config())
+    assert rebuilt.get_config() == cache.get_config()
+
+
+def test_local_upstream_is_not_persisted():
+    cache = CachedEmbeddingFunction(CountingEmbedder(), "model")
+    assert cache.get_config()["upstream"] is None
+    assert CachedEmbeddingFunction.build_from_config(cache.get_config()) is NotImplemented
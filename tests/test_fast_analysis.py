@@ -0,0 +1,33 @@
+import pytest
+
+from benchmarks.fast_vs_llm import NEAR_MISSES
+from utils.fast_analysis import build_fast_analysis, fuzzy_present, skill_gap
+
+
+@pytest.mark.parametrize("text, skill, expected", NEAR_MISSES)
+def test_fuzzy_matching_catches_typos_not_other_words(text, skill, expected):
+    assert (fuzzy_present([skill], text) == [skill]) is expected
+
+
+def test_short_skills_only_match_exactly():
+    assert fuzzy_present(["excel", "figma"], "excels, figmas, exel") == []
+
+
+def test_look_alike_word_leaves_the_skill_missing():
+    gap = skill_gap("Excels at communication.", "We need excel and communication skills.")
+    assert gap["present_skills"] == ["communication"]
+    assert gap["missing_skills"] == ["excel"]
+
+
+def test_precomputed_jd_skills_are_used():
+    gap = skill_gap("Python and SQL.", "ignored", required=["python", "docker"])
+    assert gap["required_skills"] == ["python", "docker"]
+    assert gap["missing_skills"] == ["docker"]
+
+
+def test_fast_analysis_shape():
+    data = build_fast_analysis("Experience\n- Built APIs in Python.\nSkills\npython", "python and docker")
+    assert set(data) >= {"skill_gap_analysis", "improvement_suggestions", "formatting_feedback",
+                         "overall_score", "summary", "personalized_roadmap"}
+    assert 0 <= data["overall_score"] <= 100
+    assert [s["skill"] for s in data["improvement_suggestions"]] == ["docker"]
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from utils.json_stream import JSONObjectStream
+
+DOCUMENT = {
+    "skill_gap_analysis": {"required_skills": ["python", "sql"], "missing_skills": ["sql"]},
+    "improvement_suggestions": [{"skill": "sql", "suggestion": "Say \"SQL\" {twice}, [not] once: a, b"}],
+    "overall_score": 72,
+    "summary": "Backslash \\ and unicode é survive; so does a } brace.",
+    "empty": {},
+}
+
+
+def feed_in_chunks(text, size):
+    parser = JSONObjectStream()
+    members = []
+    for start in range(0, len(text), size):
+        members += parser.feed(text[start:start + size])
+    return parser, members
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 10_000])
+def test_every_member_is_emitted_once_in_order(size):
+    parser, members = feed_in_chunks(json.dumps(DOCUMENT), size)
+    assert members == list(DOCUMENT.items())
+    assert parser.done
+
+
+def test_pretty_printed_json_with_whitespace():
+    parser, members = feed_in_chunks(json.dumps(DOCUMENT, indent=2), 5)
+    assert dict(members) == DOCUMENT
+    assert parser.done
+
+
+def test_member_is_emitted_as_soon_as_it_is_complete():
+    parser = JSONObjectStream()
+    assert parser.feed('{"a": {"b": [1, 2') == []
+    assert parser.feed(']}, "c"') == [("a", {"b": [1, 2]})]
+    assert parser.feed(': "x"') == []
+    assert parser.feed("}") == [("c", "x")]
+    assert parser.done
+
+
+def test_truncated_document_is_not_done():
+    parser, members = feed_in_chunks(json.dumps(DOCUMENT)[:-20], 3)
+    assert not parser.done
+    assert [key for key, _ in members] == ["skill_gap_analysis", "improvement_suggestions", "overall_score"]
+
+
+def test_text_after_the_object_is_ignored():
+    parser = JSONObjectStream()
+    assert parser.feed('{"a": 1}\n{"b": 2}') == [("a", 1)]
+    assert parser.feed('{"c": 3}') == []
+
+
+def test_empty_object():
+    parser = JSONObjectStream()
+    assert parser.feed("{}") == []
+    assert parser.done
+
+
+def test_malformed_member_raises():
+    parser = JSONObjectStream()
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed('{"a": nope,')
@@ -0,0 +1,225 @@
+import asyncio
+import time
+
+import pytest
+
+from config.config import Settings
+from utils.llm_router import (
+    AllProvidersFailed, CircuitBreaker, CircuitOpenError, LLMRouter, Provider, _discard, build_router,
+)
+
+
+class ServerError(Exception):
+    status_code = 503
+
+
+class BadRequest(Exception):
+    status_code = 400
+
+
+class FakeClient:
+    """
+    Stands in for AsyncOpenAI: each call waits `latency` seconds, then
+    raises the next scripted error (if any) or answers with `answer`.
+    """
+
+    def __init__(self, answer="ok", latency=0.0, errors=()):
+        self.answer, self.latency = answer, latency
+        self.errors = list(errors)
+        self.calls = self.cancelled = 0
+        self.chat = self.completions = self
+
+    async def create(self, model, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.answer
+
+
+def provider(name, client, **kwargs):
+    kwargs.setdefault("max_retries", 0)
+    return Provider(name, client, "model", backoff=0, **kwargs)
+
+
+def chat(router):
+    return asyncio.run(router.chat(messages=[]))
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failures=3, reset_after=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow() and not breaker.is_open
+
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_lets_one_probe_through(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failures=1, reset_after=30)
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    now[0] += 31
+    assert breaker.allow()
+    assert not breaker.allow()  # only one probe at a time
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+
+
+def test_breaker_failed_probe_reopens(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failures=5, reset_after=30)
+    for _ in range(5):
+        breaker.record_failure()
+
+    now[0] += 31
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.is_open
+
+    now[0] += 31
+    assert breaker.allow()
+    breaker.cancel_probe()  # a cancelled probe frees the slot for the next one
+    assert breaker.allow()
+
+
+def test_provider_retries_retryable_errors():
+    client = FakeClient(errors=[ServerError(), asyncio.TimeoutError()])
+    p = provider("a", client, max_retries=2)
+    assert asyncio.run(p.complete(messages=[])) == "ok"
+    assert client.calls == 3
+
+
+def test_provider_does_not_retry_bad_requests_or_blame_the_provider():
+    client = FakeClient(errors=[BadRequest()])
+    p = provider("a", client, max_retries=2, breaker=CircuitBreaker(failures=1))
+    with pytest.raises(BadRequest):
+        asyncio.run(p.complete(messages=[]))
+    assert client.calls == 1
+    assert not p.breaker.is_open
+
+
+def test_provider_times_out():
+    p = provider("a", FakeClient(latency=1), timeout=0.05)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(p.complete(messages=[]))
+    assert p.breaker.consecutive == 1
+
+
+def test_provider_with_open_circuit_is_not_called():
+    client = FakeClient()
+    p = provider("a", client, breaker=CircuitBreaker(failures=1, reset_after=60))
+    p.breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(p.complete(messages=[]))
+    assert client.calls == 0
+
+
+def test_router_fails_over_on_error():
+    primary = provider("primary", FakeClient(errors=[ServerError()]))
+    secondary = provider("secondary", FakeClient(answer="from secondary"))
+    response, winner = chat(LLMRouter([primary, secondary], hedge=False))
+    assert (response, winner) == ("from secondary", secondary)
+
+
+def test_router_raises_when_every_provider_fails():
+    router = LLMRouter([provider("a", FakeClient(errors=[ServerError()])),
+                        provider("b", FakeClient(errors=[BadRequest()]))], hedge=False)
+    with pytest.raises(AllProvidersFailed) as info:
+        chat(router)
+    assert [(name, type(error)) for name, error in info.value.errors] == [("a", ServerError), ("b", BadRequest)]
+
+
+def test_router_skips_providers_with_open_circuits():
+    down = provider("down", FakeClient(), breaker=CircuitBreaker(failures=1, reset_after=60))
+    down.breaker.record_failure()
+    up = provider("up", FakeClient(answer="up"), breaker=CircuitBreaker(failures=1, reset_after=60))
+    router = LLMRouter([down, up], hedge=False)
+
+    assert chat(router) == ("up", up)
+    assert down.client.calls == 0
+    assert router.circuit_states() == {"down": 1, "up": 0}
+
+    up.breaker.record_failure()
+    with pytest.raises(AllProvidersFailed):
+        chat(router)
+
+
+def test_hedge_races_a_slow_primary_and_cancels_the_loser():
+    slow = FakeClient(answer="slow", latency=1)
+    fast = FakeClient(answer="fast", latency=0.01)
+    router = LLMRouter([provider("slow", slow), provider("fast", fast)], hedge_delay=0.05)
+
+    async def run():
+        started = time.perf_counter()
+        response, winner = await router.chat(messages=[])
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(0)  # let the cancellation land
+        return response, winner.name, elapsed
+
+    response, winner, elapsed = asyncio.run(run())
+    assert (response, winner) == ("fast", "fast")
+    assert elapsed < 0.5
+    assert slow.cancelled == 1
+
+
+def test_no_hedge_when_the_primary_answers_in_time():
+    primary = FakeClient(answer="primary", latency=0.01)
+    secondary = FakeClient(answer="secondary")
+    router = LLMRouter([provider("primary", primary), provider("secondary", secondary)], hedge_delay=0.5)
+    assert chat(router)[0] == "primary"
+    assert secondary.calls == 0
+
+
+def test_hedge_delay_follows_observed_latency():
+    p = provider("a", FakeClient())
+    router = LLMRouter([p], hedge_delay=10.0)
+    assert router.hedge_delay(p) == 10.0
+
+    for ms in range(1, 101):
+        p.latency[False].add(ms / 1000)
+    assert router.hedge_delay(p) == pytest.approx(0.096)
+    assert router.hedge_delay(p, stream=True) == 10.0
+
+
+def test_discarded_loser_is_cancelled_or_its_stream_closed():
+    class Stream:
+        closed = False
+
+        async def close(self):
+            self.closed = True
+
+    async def run():
+        stream = Stream()
+        finished = asyncio.ensure_future(asyncio.sleep(0, result=stream))
+        running = asyncio.ensure_future(asyncio.sleep(1))
+        await asyncio.sleep(0.01)
+        _discard(finished)
+        _discard(running)
+        await asyncio.sleep(0.01)
+        return stream, running
+
+    stream, running = asyncio.run(run())
+    assert stream.closed
+    assert running.cancelled()
+
+
+def test_build_router_skips_providers_without_keys():
+    router = build_router(Settings(openai_api_key="key", llm_providers="openai,groq"))
+    assert [p.name for p in router.providers] == ["openai"]
+
+    with pytest.raises(ValueError, match="Unknown LLM provider"):
+        build_router(Settings(openai_api_key="key", llm_providers="openai,bedrock"))
@@ -0,0 +1,113 @@
+import pytest
+
+from utils import prompt_builder
+from utils.prompt_builder import (
+    PackedJD, count_tokens, normalize_lines, pack_jd, pack_lines, pack_prompt_inputs,
+)
+
+MODEL = "gpt-4o"
+
+RESUME = """Jane Doe
+Backend Developer
+jane@example.com | +1 555 0100
+Summary
+Friendly engineer who enjoys hiking, chess and cooking on weekends.
+Experience
+Senior Engineer, Acme Corp, 2020-2024
+- Built Kubernetes operators in Go for 40 services.
+- Organised the office book club and summer party.
+Engineer, Initech, 2016-2020
+- Wrote SQL reporting pipelines on PostgreSQL.
+- Planned team offsites.
+Skills
+python, sql, kubernetes, go
+Page 2 of 2
+"""
+
+JD = "We need a backend engineer with kubernetes, sql and go experience."
+JD_SKILLS = {"kubernetes", "sql"}
+JD_KEYWORDS = {"backend", "engineer", "kubernetes", "sql"}
+
+
+@pytest.fixture(autouse=True)
+def estimated_tokens(monkeypatch):
+    # Budgets below are sized for the length-based estimate, so the outcome
+    # does not depend on whether tiktoken can load its vocabulary here.
+    monkeypatch.setattr(prompt_builder, "get_encoding", lambda model: None)
+
+
+def test_normalize_lines_cleans_bullets_and_noise():
+    lines = normalize_lines("  Skills  \n\n• python,   sql\n* docker\n---\nPage 1 of 2\n7\n")
+    assert lines == ["Skills", "- python, sql", "- docker"]
+
+
+def test_normalize_lines_drops_repeated_lines():
+    lines = normalize_lines("Jane Doe\nSkills\npython\nJANE DOE\nSkills:\n- python")
+    assert lines == ["Jane Doe", "Skills", "python"]
+
+
+def test_repeated_sentences_inside_long_lines_are_dropped():
+    paragraph = " ".join(["We build reliable data pipelines in Python."] * 3 + ["Equal opportunity employer."] * 34)
+    lines = normalize_lines(paragraph + "\nEqual opportunity employer.")
+    assert lines == ["We build reliable data pipelines in Python.", "Equal opportunity employer."]
+
+
+def test_short_lines_are_not_split_into_sentences():
+    assert normalize_lines("Led a team. Shipped v2.") == ["Led a team. Shipped v2."]
+
+
+def test_everything_is_kept_when_it_fits():
+    lines = normalize_lines(RESUME)
+    text, tokens = pack_lines(lines, 10_000, MODEL)
+    assert text == "\n".join(lines)
+    assert tokens == sum(count_tokens(line, MODEL) + 1 for line in lines)
+
+
+def test_packing_respects_the_budget_and_keeps_reading_order():
+    lines = normalize_lines(RESUME)
+    for budget in (20, 40, 60, 80):
+        text, tokens = pack_lines(lines, budget, MODEL, JD_SKILLS, JD_KEYWORDS, header_lines=3)
+        kept = text.splitlines()
+        assert tokens <= budget
+        assert sum(count_tokens(line, MODEL) + 1 for line in kept) == tokens
+        assert kept == [line for line in lines if line in kept]
+
+
+def test_packing_prefers_lines_matching_the_jd_with_their_context():
+    lines = normalize_lines(RESUME)
+    text, _ = pack_lines(lines, 80, MODEL, JD_SKILLS, JD_KEYWORDS, header_lines=3)
+
+    # A bullet brings its section heading and the role it belongs to.
+    assert text.splitlines() == [
+        "Jane Doe", "Backend Developer", "jane@example.com | +1 555 0100",
+        "Experience",
+        "Senior Engineer, Acme Corp, 2020-2024",
+        "- Built Kubernetes operators in Go for 40 services.",
+        "Engineer, Initech, 2016-2020",
+        "- Wrote SQL reporting pipelines on PostgreSQL.",
+        "Skills",
+        "python, sql, kubernetes, go",
+    ]
+
+
+def test_pack_jd_extracts_skills_once():
+    jd = pack_jd(JD, MODEL, budget=300)
+    assert isinstance(jd, PackedJD)
+    assert set(jd.skills) >= JD_SKILLS
+    assert jd.text == JD
+    assert jd.tokens == count_tokens(JD, MODEL) + 1
+    assert "backend" in jd.keywords
+
+
+def test_pack_jd_truncates_a_single_oversized_line():
+    jd = pack_jd("kubernetes " * 2000, MODEL, budget=50)
+    assert jd.text
+    assert jd.tokens <= 50
+
+
+def test_prompt_inputs_accept_text_or_a_packed_jd():
+    from_text = pack_prompt_inputs(RESUME, JD, MODEL, resume_budget=60, jd_budget=300)
+    from_packed = pack_prompt_inputs(RESUME, pack_jd(JD, MODEL, 300), MODEL, resume_budget=60)
+    assert from_text == from_packed
+    assert 0 < from_text.resume_tokens <= 60
+    assert from_text.jd_text == JD
@@ -0,0 +1,201 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.result_cache import MemoryBackend, ResultCache, SQLiteBackend, make_cache_key
+
+
+class StubLLM:
+    """
+    Stands in for an analysis call: counts invocations and answers after
+    `delay` seconds (or raises `error`).
+    """
+
+    def __init__(self, delay=0.05, error=None):
+        self.delay, self.error = delay, error
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return {"overall_score": 72, "call": self.calls}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryBackend(max_entries=10)
+    return SQLiteBackend(str(tmp_path / "results.sqlite3"), max_entries=10)
+
+
+def test_cache_key_ignores_jd_whitespace_but_not_model():
+    key = make_cache_key(b"resume", "python  and\nsql", "gpt-4o", 2)
+    assert key == make_cache_key(b"resume", "python and sql", "gpt-4o", 2)
+    assert key != make_cache_key(b"resume", "python and sql", "gpt-4o-mini", 2)
+    assert key != make_cache_key(b"resume", "python and sql", "gpt-4o", 3)
+
+
+def test_concurrent_requests_share_one_call(backend):
+    llm = StubLLM()
+    cache = ResultCache(backend)
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_compute("k", llm) for _ in range(10)))
+
+    results = asyncio.run(run())
+    cache.close()
+
+    assert llm.calls == 1
+    assert all(result == {"overall_score": 72, "call": 1} for result in results)
+    assert cache.stats["misses"] == 1
+    assert cache.stats["coalesced"] == 9
+
+
+def test_coalesced_callers_get_their_own_copy(backend):
+    cache = ResultCache(backend)
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_compute("k", StubLLM()) for _ in range(2)))
+
+    first, second = asyncio.run(run())
+    cache.close()
+    first["overall_score"] = 0
+    assert second["overall_score"] == 72
+
+
+def test_result_is_served_from_cache_afterwards(backend):
+    llm = StubLLM()
+    cache = ResultCache(backend)
+
+    async def run():
+        await cache.get_or_compute("k", llm)
+        return await cache.get_or_compute("k", llm)
+
+    assert asyncio.run(run())["call"] == 1
+    cache.close()
+    assert llm.calls == 1
+    assert cache.snapshot()["hits"] == 1
+    assert cache.snapshot()["entries"] == 1
+
+
+def test_entries_expire_after_ttl(backend):
+    llm = StubLLM(delay=0)
+    cache = ResultCache(backend, ttl=0.05)
+
+    async def run():
+        await cache.get_or_compute("k", llm)
+        time.sleep(0.1)
+        assert await cache.get("k") is None
+        await cache.get_or_compute("k", llm)
+
+    asyncio.run(run())
+    cache.close()
+    assert llm.calls == 2
+
+
+def test_should_cache_keeps_fallbacks_out(backend):
+    llm = StubLLM(delay=0)
+    cache = ResultCache(backend)
+
+    async def run():
+        await cache.get_or_compute("k", llm, should_cache=lambda value: False)
+        return await cache.get("k")
+
+    assert asyncio.run(run()) is None
+    cache.close()
+
+
+def test_failures_reach_every_waiter_and_are_not_cached(backend):
+    llm = StubLLM(error=RuntimeError("upstream down"))
+    cache = ResultCache(backend)
+
+    async def run():
+        results = await asyncio.gather(*(cache.get_or_compute("k", llm) for _ in range(3)),
+                                       return_exceptions=True)
+        return results, await cache.get("k")
+
+    results, cached = asyncio.run(run())
+    cache.close()
+    assert llm.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cached is None
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call(backend):
+    llm = StubLLM()
+    cache = ResultCache(backend)
+
+    async def run():
+        leaving = asyncio.ensure_future(cache.get_or_compute("k", llm))
+        staying = asyncio.ensure_future(cache.get_or_compute("k", llm))
+        await asyncio.sleep(0.01)
+        leaving.cancel()
+        result = await staying
+        return result, await cache.get("k")
+
+    result, cached = asyncio.run(run())
+    cache.close()
+    assert llm.calls == 1
+    assert result == cached
+
+
+def test_sqlite_calls_run_off_the_event_loop(tmp_path):
+    threads = []
+
+    class RecordingBackend(SQLiteBackend):
+        def get(self, key):
+            threads.append(threading.current_thread())
+            return super().get(key)
+
+        def set(self, key, payload, cost, ttl):
+            threads.append(threading.current_thread())
+            super().set(key, payload, cost, ttl)
+
+    cache = ResultCache(RecordingBackend(str(tmp_path / "results.sqlite3")))
+
+    async def run():
+        await cache.get_or_compute("k", StubLLM(delay=0))
+        await cache.put("other", {"a": 1}, 0.1)
+        await cache.get("other")
+
+    asyncio.run(run())
+    cache.close()
+    assert len(threads) == 4
+    assert threading.main_thread() not in threads
+
+
+def test_memory_backend_is_bounded():
+    backend = MemoryBackend(max_entries=2)
+    for key in "abc":
+        backend.set(key, "{}", 0.1, ttl=60)
+    assert len(backend) == 2
+    assert backend.get("a") is None
+
+
+def test_sqlite_backend_persists_and_is_bounded(tmp_path):
+    path = str(tmp_path / "results.sqlite3")
+    backend = SQLiteBackend(path, max_entries=2)
+    for key in "abc":
+        backend.set(key, '{"key": "%s"}' % key, 0.1, ttl=60)
+        time.sleep(0.01)
+
+    reopened = SQLiteBackend(path, max_entries=2)
+    assert len(reopened) == 2
+    assert reopened.get("a") is None
+    assert reopened.get("c") == ('{"key": "c"}', 0.1)
+
+
+def test_cache_key_changes_with_the_prompt_budgets():
+    import dataclasses
+
+    import app as app_module
+
+    keys = {
+        app_module.prompt_key(dataclasses.replace(app_module.settings, resume_token_budget=resume, jd_token_budget=jd))
+        for resume, jd in ((600, 300), (800, 300), (600, 200))
+    }
+    assert len(keys) == 3
@@ -0,0 +1,102 @@
+import json
+import uuid
+
+import chromadb
+import numpy as np
+import pytest
+
+from utils.seed_chromadb import iter_corpus, seed
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.texts = 0
+
+    def __call__(self, input):
+        self.texts += len(input)
+        return [np.ones(8, dtype=np.float32) * (i + 1) for i in range(len(input))]
+
+
+@pytest.fixture
+def collection():
+    return chromadb.EphemeralClient().get_or_create_collection(f"bullets-{uuid.uuid4().hex}",
+                                                               embedding_function=None)
+
+
+def seed_with(collection, rows, **kwargs):
+    embed = CountingEmbedder()
+
+    class Embedded:
+        # Embed locally so Chroma never needs an embedding function.
+        def get(self, **kw):
+            return collection.get(**kw)
+
+        def upsert(self, ids, documents, metadatas):
+            collection.upsert(ids=ids, documents=documents, metadatas=metadatas, embeddings=embed(documents))
+
+    return seed(rows, Embedded(), **kwargs), embed
+
+
+def write_jsonl(path, rows):
+    path.write_text("\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows) + "\n")
+
+
+def row(i, **overrides):
+    return {"bullet": f"Bullet {i}", "skill": "python", "domain": "it", "role": "developer", **overrides}
+
+
+def test_bad_rows_are_skipped_and_reported(tmp_path, collection):
+    path = tmp_path / "corpus.jsonl"
+    write_jsonl(path, [row(1), {"bullet": "No skill"}, "{not json", row(2, role=None), row(3, skill="  sql ")])
+    invalid = []
+
+    stats, _ = seed_with(collection, iter_corpus(str(path), invalid), batch_size=2)
+
+    assert [number for number, _ in invalid] == [2, 3, 4]
+    assert "skill" in invalid[0][1] and "role" in invalid[2][1]
+    assert stats == {"rows": 2, "upserted": 2, "skipped": 0}
+    assert sorted(meta["skill"] for meta in collection.get()["metadatas"]) == ["python", "sql"]
+
+
+def test_csv_rows_missing_a_column(tmp_path, collection):
+    path = tmp_path / "corpus.csv"
+    path.write_text("bullet,skill,domain,role\nBuilt APIs,python,it,dev\nShort row,sql,it\nShipped,docker,it,ops\n")
+    invalid = []
+    stats, _ = seed_with(collection, iter_corpus(str(path), invalid))
+    assert invalid == [(3, "missing or empty role")]
+    assert stats["upserted"] == 2
+
+
+def test_reruns_only_embed_new_or_changed_rows(tmp_path, collection):
+    path = tmp_path / "corpus.jsonl"
+    write_jsonl(path, [row(i) for i in range(5)])
+    seed_with(collection, iter_corpus(str(path)))
+
+    write_jsonl(path, [row(i) for i in range(5)] + [row(5)])
+    stats, embed = seed_with(collection, iter_corpus(str(path)))
+    assert stats == {"rows": 6, "upserted": 1, "skipped": 5}
+    assert embed.texts == 1
+
+    write_jsonl(path, [row(0, skill="go")])
+    stats, embed = seed_with(collection, iter_corpus(str(path)))
+    assert stats["upserted"] == 1
+
+
+def test_checkpoint_resumes_after_the_last_flushed_batch(tmp_path, collection):
+    path = tmp_path / "corpus.jsonl"
+    write_jsonl(path, [row(i) for i in range(10)])
+    checkpoint = str(tmp_path / "checkpoint.json")
+
+    def interrupted():
+        for i, item in enumerate(iter_corpus(str(path))):
+            if i == 7:
+                raise KeyboardInterrupt
+            yield item
+
+    with pytest.raises(KeyboardInterrupt):
+        seed_with(collection, interrupted(), batch_size=3, checkpoint_path=checkpoint, source="corpus")
+    stats, embed = seed_with(collection, iter_corpus(str(path)), batch_size=3,
+                             checkpoint_path=checkpoint, source="corpus")
+    assert stats["skipped"] == 6
+    assert embed.texts == 4
+    assert collection.count() == 10
@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from config.config import Settings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_values_are_cast_from_the_environment(monkeypatch):
+    monkeypatch.setenv("LLM_CONCURRENCY", "7")
+    monkeypatch.setenv("LLM_HEDGE", "false")
+    monkeypatch.setenv("LLM_TIMEOUT", "")
+    settings = Settings.from_env()
+    assert (settings.llm_concurrency, settings.llm_hedge, settings.llm_timeout) == (7, False, 60.0)
+
+
+def test_bad_value_names_the_variable(monkeypatch):
+    monkeypatch.setenv("LLM_CONCURRENCY", "abc")
+    with pytest.raises(ValueError, match="LLM_CONCURRENCY: 'abc'"):
+        Settings.from_env()
+
+
+def test_importing_the_app_builds_nothing():
+    code = (
+        "import app\n"
+        "from utils.resources import RESOURCES\n"
+        "print(sorted(RESOURCES._items))\n"
+    )
+    env = {**os.environ, "SKILL_TAXONOMY_PATH": "/nonexistent/taxonomy.json"}
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
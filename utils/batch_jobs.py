@@ -0,0 +1,204 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BatchJob:
+    """
+    Progress and results of one /analyze/batch run.
+
+    Results are kept in completion order; any number of listeners can
+    subscribe and will first receive everything recorded so far, so a client
+    that reconnects (or polls) loses nothing.
+    """
+
+    def __init__(self, total, jd_required_skills=None):
+        self.id = uuid.uuid4().hex
+        self.total = total
+        self.jd_required_skills = jd_required_skills or []
+        self.results = []
+        self.completed = 0
+        self.failed = 0
+        self.status = "running"
+        self.created_at = time.time()
+        self.finished_at = None
+        self.task = None
+        self.store = None  # the JobStore persisting this job, if any
+        self._subscribers = []
+
+    def record(self, item):
+        self.results.append(item)
+        if item.get("status") == "ok":
+            self.completed += 1
+        else:
+            self.failed += 1
+        if self.store is not None:
+            self.store.save_result(self, item)
+        for queue in self._subscribers:
+            queue.put_nowait(item)
+
+    def finish(self, status="done"):
+        if self.status != "running":
+            return
+        self.status = status
+        self.finished_at = time.time()
+        if self.store is not None:
+            self.store.save_job(self)
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+    async def events(self):
+        """
+        Yield every result (past and future) until the job finishes.
+        """
+        queue = asyncio.Queue()
+        for item in self.results:
+            queue.put_nowait(item)
+        if self.status != "running":
+            queue.put_nowait(None)
+        else:
+            self._subscribers.append(queue)
+        try:
+            while (item := await queue.get()) is not None:
+                yield item
+        finally:
+            if queue in self._subscribers:
+                self._subscribers.remove(queue)
+
+    def shortlist(self, limit=None):
+        """
+        Successfully analyzed resumes, best `overall_score` first.
+        """
+        ranked = sorted(
+            (r for r in self.results if r.get("status") == "ok"),
+            key=lambda r: r["result"].get("overall_score") or 0,
+            reverse=True,
+        )
+        return ranked[:limit] if limit else ranked
+
+    def progress(self):
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "jd_required_skills": self.jd_required_skills,
+            "elapsed_s": round((self.finished_at or time.time()) - self.created_at, 3),
+        }
+
+
+class JobStore:
+    """
+    In-process registry of batch jobs; the oldest finished jobs are dropped
+    once more than `max_jobs` are held.
+
+    Held in memory only, a job is visible to the worker process that runs
+    it and is gone after a restart, so polling needs a single worker (or
+    sticky routing). With `path`, progress and results are also written to
+    an SQLite file, so any worker on the host can answer a poll and
+    finished jobs survive restarts. Writes go through one background
+    thread, in order, never on the event loop.
+    """
+
+    def __init__(self, max_jobs=100, path=None):
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        self._db = self._executor = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS batch_jobs (id TEXT PRIMARY KEY, total INTEGER NOT NULL, "
+                "jd_required_skills TEXT NOT NULL, status TEXT NOT NULL, created_at REAL NOT NULL, "
+                "finished_at REAL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS batch_results (job_id TEXT NOT NULL, seq INTEGER NOT NULL, "
+                "item TEXT NOT NULL, PRIMARY KEY (job_id, seq)) WITHOUT ROWID"
+            )
+            self._db.commit()
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="batch-jobs")
+
+    def add(self, job):
+        self._jobs[job.id] = job
+        finished = [job_id for job_id, j in self._jobs.items() if j.status != "running"]
+        for job_id in finished[:max(0, len(self._jobs) - self.max_jobs)]:
+            del self._jobs[job_id]
+        if self._db is not None:
+            job.store = self
+            self.save_job(job)
+        return job
+
+    async def get(self, job_id):
+        """
+        The job, from this process if it runs here, else from the SQLite
+        file (a read-only snapshot), else None.
+        """
+        job = self._jobs.get(job_id)
+        if job is None and self._db is not None:
+            job = await asyncio.get_running_loop().run_in_executor(self._executor, self._load, job_id)
+        return job
+
+    def save_job(self, job):
+        row = (job.id, job.total, json.dumps(job.jd_required_skills), job.status, job.created_at, job.finished_at)
+        self._submit(self._write_job, row)
+
+    def save_result(self, job, item):
+        self._submit(self._write_result, job.id, len(job.results) - 1, json.dumps(item))
+
+    def close(self):
+        """
+        Mark this process's unfinished jobs as interrupted and flush writes.
+        """
+        for job in self._jobs.values():
+            if job.status == "running":
+                if job.task is not None:
+                    job.task.cancel()
+                job.finish("interrupted")
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _submit(self, fn, *args):
+        def report(future):
+            if future.exception() is not None:
+                print(f"Saving batch job progress failed: {future.exception()!r}")
+
+        self._executor.submit(fn, *args).add_done_callback(report)
+
+    def _write_job(self, row):
+        self._db.execute("INSERT OR REPLACE INTO batch_jobs VALUES (?, ?, ?, ?, ?, ?)", row)
+        stale = [r[0] for r in self._db.execute(
+            "SELECT id FROM batch_jobs WHERE status != 'running' ORDER BY created_at DESC LIMIT -1 OFFSET ?",
+            (self.max_jobs,))]
+        self._db.executemany("DELETE FROM batch_jobs WHERE id = ?", [(i,) for i in stale])
+        self._db.executemany("DELETE FROM batch_results WHERE job_id = ?", [(i,) for i in stale])
+        self._db.commit()
+
+    def _write_result(self, job_id, seq, item):
+        self._db.execute("INSERT OR REPLACE INTO batch_results VALUES (?, ?, ?)", (job_id, seq, item))
+        self._db.commit()
+
+    def _load(self, job_id):
+        row = self._db.execute(
+            "SELECT total, jd_required_skills, status, created_at, finished_at FROM batch_jobs WHERE id = ?",
+            (job_id,)).fetchone()
+        if row is None:
+            return None
+        total, skills, status, created_at, finished_at = row
+        job = BatchJob(total, json.loads(skills))
+        job.id, job.status, job.created_at, job.finished_at = job_id, status, created_at, finished_at
+        for (item,) in self._db.execute("SELECT item FROM batch_results WHERE job_id = ? ORDER BY seq", (job_id,)):
+            item = json.loads(item)
+            job.results.append(item)
+            if item.get("status") == "ok":
+                job.completed += 1
+            else:
+                job.failed += 1
+        return job
@@ -0,0 +1,183 @@
+"""
+Search over previously analyzed resumes: JD in, best matching candidates out.
+
+Every analyzed resume is embedded once into the persistent `candidates`
+Chroma collection (cosine HNSW) and its taxonomy skills go into an SQLite
+inverted index (skill -> candidate ids). A search embeds the JD, narrows the
+candidates to those holding every must-have skill via the inverted index,
+and runs one ANN query over what is left; no LLM call is involved.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from utils.prompt_builder import normalize_lines
+from utils.skill_matcher import get_skill_matcher
+
+EMBED_CHAR_LIMIT = 8000  # well inside the embedding model's input limit
+# Up to this many skill-filtered candidates, Chroma is asked to search only
+# among their ids; beyond it the filter is barely selective, so an
+# oversampled plain ANN query is post-filtered instead.
+ID_FILTER_LIMIT = 20000
+OVERSAMPLE = 4
+
+
+def candidate_id(resume_bytes):
+    return hashlib.sha256(resume_bytes).hexdigest()[:32]
+
+
+def canonical_skills(skills):
+    """
+    Taxonomy names for user-supplied skills ("k8s" -> "kubernetes");
+    unknown ones are kept as lower-cased text.
+    """
+    out = []
+    for skill in skills:
+        out += get_skill_matcher().extract(skill) or [" ".join(skill.lower().split())]
+    return list(dict.fromkeys(s for s in out if s))
+
+
+def analyzed_skills(analysis):
+    """
+    The skills an /analyze/ result found in the resume.
+    """
+    present = (analysis.get("skill_gap_analysis") or {}).get("present_skills")
+    return [skill for skill in present if isinstance(skill, str)] if isinstance(present, list) else []
+
+
+class SkillIndex:
+    """
+    SQLite inverted index from canonical skill to candidate ids.
+    """
+
+    def __init__(self, path):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS candidate_skills (skill TEXT NOT NULL, candidate_id TEXT NOT NULL, "
+            "PRIMARY KEY (skill, candidate_id)) WITHOUT ROWID"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS candidate_skills_id ON candidate_skills(candidate_id)")
+        self._db.commit()
+
+    def set_skills(self, rows):
+        """
+        Replace the skills of each (candidate_id, skills) in `rows`.
+        """
+        rows = list(rows)
+        with self._lock:
+            self._db.executemany("DELETE FROM candidate_skills WHERE candidate_id = ?", [(cid,) for cid, _ in rows])
+            self._db.executemany(
+                "INSERT OR IGNORE INTO candidate_skills (skill, candidate_id) VALUES (?, ?)",
+                [(skill, cid) for cid, skills in rows for skill in skills],
+            )
+            self._db.commit()
+
+    def candidates_with(self, skills):
+        """
+        Ids of candidates holding every one of `skills`.
+        """
+        if not skills:
+            return []
+        query = " INTERSECT ".join(["SELECT candidate_id FROM candidate_skills WHERE skill = ?"] * len(skills))
+        with self._lock:
+            return [row[0] for row in self._db.execute(query, list(skills))]
+
+    def unknown(self, skills):
+        """
+        Those of `skills` that no indexed candidate holds.
+        """
+        with self._lock:
+            return [skill for skill in skills
+                    if self._db.execute("SELECT 1 FROM candidate_skills WHERE skill = ? LIMIT 1", (skill,)).fetchone()
+                    is None]
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(DISTINCT candidate_id) FROM candidate_skills").fetchone()[0]
+
+
+class CandidateIndex:
+    def __init__(self, collection, skill_index, embedding_function):
+        self.collection = collection
+        self.skills = skill_index
+        self.embed = embedding_function
+
+    def add(self, candidate_id, resume_text, analysis=None):
+        self.add_many([(candidate_id, resume_text, analysis)])
+
+    def add_many(self, items):
+        """
+        Index (candidate_id, resume_text, analysis) triples; re-adding an id
+        replaces it. `analysis` is the /analyze/ result, if any: its score
+        and summary are kept for display, and the skills it found present
+        are indexed along with the taxonomy matches in the text.
+        """
+        ids, texts, metadatas, skill_rows = [], [], [], []
+        now = time.time()
+        for cid, resume_text, analysis in items:
+            lines = normalize_lines(resume_text)
+            analysis = analysis or {}
+            skills = canonical_skills(get_skill_matcher().extract(resume_text) + analyzed_skills(analysis))
+            metadata = {"headline": lines[0][:120] if lines else "", "skills": ", ".join(skills), "indexed_at": now}
+            if isinstance(analysis.get("overall_score"), (int, float)):
+                metadata["last_score"] = analysis["overall_score"]
+            if isinstance(analysis.get("summary"), str):
+                metadata["summary"] = analysis["summary"][:500]
+            ids.append(cid)
+            texts.append("\n".join(lines)[:EMBED_CHAR_LIMIT])
+            metadatas.append(metadata)
+            skill_rows.append((cid, skills))
+        if not ids:
+            return
+        self.collection.upsert(ids=ids, embeddings=self.embed(texts), metadatas=metadatas)
+        self.skills.set_skills(skill_rows)
+
+    def _query(self, vector, n, ids=None):
+        result = self.collection.query(
+            query_embeddings=[vector], n_results=n, ids=ids, include=["metadatas", "distances"],
+        )
+        return list(zip(result["ids"][0], result["metadatas"][0], result["distances"][0]))
+
+    def search(self, jd_text, top_n=10, must_have=()):
+        """
+        The `top_n` indexed candidates closest to the JD that hold every
+        must-have skill, best first.
+        """
+        must_have = canonical_skills(must_have)
+        allowed = self.skills.candidates_with(must_have) if must_have else None
+        total = self.collection.count()
+        if total == 0 or allowed == []:
+            return []
+        vector = self.embed([jd_text])[0]
+        if allowed is None:
+            hits = self._query(vector, min(top_n, total))
+        elif len(allowed) <= ID_FILTER_LIMIT:
+            hits = self._query(vector, min(top_n, len(allowed)), ids=allowed)
+        else:
+            allowed_set = set(allowed)
+            hits = [hit for hit in self._query(vector, min(top_n * OVERSAMPLE, total)) if hit[0] in allowed_set]
+            if len(hits) < top_n:
+                hits = self._query(vector, min(top_n, len(allowed)), ids=allowed)
+
+        jd_skills = get_skill_matcher().extract(jd_text)
+        results = []
+        for cid, metadata, distance in hits[:top_n]:
+            metadata = metadata or {}
+            skills = [s for s in metadata.get("skills", "").split(", ") if s]
+            results.append({
+                "candidate_id": cid,
+                "similarity": round(1 - distance, 4),
+                "headline": metadata.get("headline"),
+                "skills": skills,
+                "matched_skills": [s for s in jd_skills if s in skills],
+                "missing_skills": [s for s in jd_skills if s not in skills],
+                "last_score": metadata.get("last_score"),
+                "summary": metadata.get("summary"),
+            })
+        return results
@@ -0,0 +1,160 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from chromadb.api.types import EmbeddingFunction
+
+NAME = "skillsync_cached"
+
+
+class CachedEmbeddingFunction(EmbeddingFunction):
+    """
+    Content-addressed cache around any Chroma embedding function.
+
+    Vectors are keyed on sha256(model name + text). Lookups go to an
+    in-process LRU first, then to an SQLite file of float32 blobs; only
+    texts missing from both are sent upstream, in a single batched call.
+    Both tiers are size-bounded (least recently used rows are evicted).
+    """
+
+    def __init__(self, embedding_function, model_name, path=None,
+                 max_memory_items=10_000, max_disk_items=1_000_000):
+        self.embedding_function = embedding_function
+        self.model_name = model_name
+        self.path = path
+        self.max_memory_items = max_memory_items
+        self.max_disk_items = max_disk_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings(last_used)")
+            self._db.commit()
+        # Counted once here, then kept up to date, so writes never scan the table.
+        self._disk_count = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] if self._db else 0
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "upstream_calls": 0, "evictions": 0}
+
+    @staticmethod
+    def name():
+        return NAME
+
+    def get_config(self):
+        """
+        What Chroma records with a collection. The wrapped function is only
+        included when it can itself be rebuilt from a config.
+        """
+        upstream = self.embedding_function
+        rebuildable = all(getattr(type(upstream), method, None) not in (None, getattr(EmbeddingFunction, method))
+                          for method in ("name", "get_config", "build_from_config"))
+        return {
+            "model_name": self.model_name,
+            "path": self.path,
+            "max_memory_items": self.max_memory_items,
+            "max_disk_items": self.max_disk_items,
+            "upstream": {"name": upstream.name(), "config": upstream.get_config()} if rebuildable else None,
+        }
+
+    @staticmethod
+    def build_from_config(config):
+        from chromadb.utils.embedding_functions import known_embedding_functions
+
+        upstream = config.get("upstream")
+        if not upstream or upstream["name"] not in known_embedding_functions:
+            return NotImplemented
+        return CachedEmbeddingFunction(
+            known_embedding_functions[upstream["name"]].build_from_config(upstream["config"]),
+            config["model_name"], path=config.get("path"),
+            max_memory_items=config["max_memory_items"], max_disk_items=config["max_disk_items"],
+        )
+
+    def key(self, text):
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def __call__(self, input):
+        keys = [self.key(text) for text in input]
+        found = {}
+        with self._lock:
+            for k in keys:
+                if k in self._memory:
+                    self._memory.move_to_end(k)
+                    found[k] = self._memory[k]
+                    self.stats["memory_hits"] += 1
+            disk_hits = self._disk_get([k for k in dict.fromkeys(keys) if k not in found])
+            self.stats["disk_hits"] += len(disk_hits)
+            for k, vec in disk_hits.items():
+                self._remember(k, vec)
+            found.update(disk_hits)
+
+        missing = {}
+        for text, k in zip(input, keys):
+            if k not in found:
+                missing.setdefault(k, text)
+        if missing:
+            vectors = self.embedding_function(list(missing.values()))
+            fresh = {k: np.asarray(vec, dtype=np.float32) for k, vec in zip(missing, vectors)}
+            with self._lock:
+                self.stats["upstream_calls"] += 1
+                self.stats["misses"] += len(fresh)
+                for k, vec in fresh.items():
+                    self._remember(k, vec)
+                self._disk_put(fresh)
+            found.update(fresh)
+        return [found[k] for k in keys]
+
+    def hit_ratio(self):
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        total = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+    def _remember(self, key, vec):
+        self._memory[key] = vec
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, keys):
+        if self._db is None or not keys:
+            return {}
+        hits = {}
+        # SQLite caps the number of bound parameters per statement.
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = self._db.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            hits.update({k: np.frombuffer(blob, dtype=np.float32) for k, blob in rows})
+        if hits:
+            now = time.time()
+            self._db.executemany("UPDATE embeddings SET last_used = ? WHERE key = ?", [(now, k) for k in hits])
+            self._db.commit()
+        return hits
+
+    def _disk_put(self, vectors):
+        if self._db is None or not vectors:
+            return
+        now = time.time()
+        # Keys are content hashes, so a row another worker already wrote holds the same vector.
+        self._disk_count += self._db.executemany(
+            "INSERT OR IGNORE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+            [(k, vec.tobytes(), now) for k, vec in vectors.items()],
+        ).rowcount
+        overflow = self._disk_count - self.max_disk_items
+        if overflow > 0:
+            evicted = self._db.execute(
+                "DELETE FROM embeddings WHERE key IN "
+                "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)", (overflow,)
+            ).rowcount
+            self._disk_count -= evicted
+            self.stats["evictions"] += evicted
+        self._db.commit()
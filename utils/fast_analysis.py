@@ -0,0 +1,121 @@
+import difflib
+import re
+
+from utils.skill_matcher import get_skill_matcher, match_skills, suggest_rewrites
+
+SECTION_HEADINGS = ("experience", "education", "skills", "projects", "summary", "certifications")
+FUZZY_CUTOFF = 0.88
+# Shorter names are one edit away from ordinary words ("excel" / "excels").
+FUZZY_MIN_CHARS = 6
+_INFLECTIONS = ("s", "es", "ed", "er", "ers", "ing")
+
+
+def _ngrams(words, n):
+    return {" ".join(words[i:i + n]) for i in range(len(words) - n + 1)}
+
+
+def _is_misspelling(candidate, skill):
+    """
+    A near match counts only if it starts like the skill and is not the
+    skill with a plural or verb ending added or removed.
+    """
+    if candidate[0] != skill[0]:
+        return False
+    longer, shorter = (candidate, skill) if len(candidate) > len(skill) else (skill, candidate)
+    return not (longer.startswith(shorter) and longer[len(shorter):] in _INFLECTIONS)
+
+
+def fuzzy_present(skills, text, cutoff=FUZZY_CUTOFF):
+    """
+    Skills that appear in `text` under a near-miss spelling ("kubernets",
+    "javascrpt") that the exact matcher does not cover. Skills shorter than
+    FUZZY_MIN_CHARS only ever match exactly.
+    """
+    words = re.findall(r"[\w.+#/-]+", text.lower())
+    grams = {}
+    found = []
+    for skill in skills:
+        if len(skill) < FUZZY_MIN_CHARS:
+            continue
+        n = len(skill.split())
+        if n not in grams:
+            grams[n] = list(_ngrams(words, n))
+        matches = difflib.get_close_matches(skill, grams[n], n=3, cutoff=cutoff)
+        if any(_is_misspelling(match, skill) for match in matches):
+            found.append(skill)
+    return found
+
+
+def skill_gap(resume_text, jd_text, required=None):
+    """
+    Required skills come from the JD, present ones from the resume, both via
+    the taxonomy matcher (aliases already mapped to canonical names).
+    Pass `required` when the JD's skills are already known (batches).
+    """
+    if required is None:
+        required = get_skill_matcher().extract(jd_text)
+    resume_skills = set(get_skill_matcher().extract(resume_text))
+    resume_skills.update(fuzzy_present(match_skills(required, resume_skills), resume_text))
+    present = [s for s in required if s in resume_skills]
+    return {
+        "required_skills": required,
+        "present_skills": present,
+        "missing_skills": match_skills(required, resume_skills),
+    }
+
+
+def formatting_checks(resume_text):
+    text = resume_text.lower()
+    return {
+        "length": 1500 <= len(resume_text) <= 12000,
+        "sections": sum(heading in text for heading in SECTION_HEADINGS) >= 3,
+        "bullets": bool(re.search(r"^\s*[-•*▪]", resume_text, re.MULTILINE)),
+        "quantified": len(re.findall(r"\d+(?:\.\d+)?\s*(?:%|\+|k\b|m\b|x\b)", text)) >= 3,
+    }
+
+
+FORMATTING_ADVICE = {
+    "length": "Aim for one to two pages of content; the resume is either very short or very long.",
+    "sections": "Use clear section headings such as Experience, Education and Skills.",
+    "bullets": "Present achievements as bullet points rather than paragraphs.",
+    "quantified": "Quantify more achievements with numbers, percentages or scale.",
+}
+
+
+def build_fast_analysis(resume_text, jd_text, rag_examples=None, jd_skills=None):
+    """
+    Same response schema as the LLM analysis, computed locally in
+    milliseconds: rule-based skill gap, a coverage-based score and
+    suggestions backed by the RAG example bullets.
+    """
+    gap = skill_gap(resume_text, jd_text, required=jd_skills)
+    required, present, missing = gap["required_skills"], gap["present_skills"], gap["missing_skills"]
+    checks = formatting_checks(resume_text)
+
+    coverage = len(present) / len(required) if required else 0.5
+    formatting = sum(checks.values()) / len(checks)
+    score = round(100 * (0.8 * coverage + 0.2 * formatting))
+
+    suggestions = suggest_rewrites(missing, {})
+    for suggestion in suggestions:
+        example = (rag_examples or {}).get(suggestion["skill"])
+        if example:
+            suggestion["rag_example"] = example
+
+    advice = [FORMATTING_ADVICE[name] for name, ok in checks.items() if not ok]
+    summary = (
+        f"The resume covers {len(present)} of {len(required)} skills detected in the job description."
+        if required else "No known skills were detected in the job description."
+    )
+    if missing:
+        summary += f" Missing: {', '.join(missing[:5])}{'…' if len(missing) > 5 else ''}."
+
+    return {
+        "skill_gap_analysis": gap,
+        "improvement_suggestions": suggestions,
+        "formatting_feedback": " ".join(advice) or "Formatting looks solid.",
+        "overall_score": score,
+        "summary": summary,
+        "personalized_roadmap": [f"Build and document hands-on experience with {skill}." for skill in missing[:5]],
+        "mode": "fast",
+    }
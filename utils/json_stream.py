@@ -0,0 +1,63 @@
+import json
+
+
+class JSONObjectStream:
+    """
+    Incremental parser for a JSON object that arrives in chunks (e.g. a
+    streamed LLM completion).
+
+    feed() returns the (key, value) pairs of every top-level member whose
+    value became complete with that chunk, so callers can act on each
+    section without waiting for the whole document.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key_start = None
+        self._key = None
+        self._value_start = None
+        self.done = False
+
+    def feed(self, chunk):
+        members = []
+        self._buf += chunk
+        buf = self._buf
+        for i in range(self._pos, len(buf)):
+            if self.done:
+                break
+            ch = buf[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._value_start is None and self._key_start is None:
+                    self._key_start = i
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.done = True
+                    if self._value_start is not None:
+                        members.append(self._member(i))
+            elif self._depth == 1 and ch == ":" and self._value_start is None:
+                self._key = json.loads(buf[self._key_start:i])
+                self._value_start = i + 1
+            elif self._depth == 1 and ch == ",":
+                members.append(self._member(i))
+        self._pos = len(buf)
+        return members
+
+    def _member(self, end):
+        member = (self._key, json.loads(self._buf[self._value_start:end]))
+        self._key_start = self._key = self._value_start = None
+        return member
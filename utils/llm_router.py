@@ -0,0 +1,259 @@
+"""
+Routes chat completions across OpenAI-compatible providers (OpenAI, Groq,
+a self-hosted vLLM, ...).
+
+Each provider has its own timeout, retry budget, concurrency limit, rolling
+latency window and circuit breaker. A call goes to the first provider whose
+circuit is closed; if it has not answered within that provider's recent p95
+latency, the next provider is raced against it (a hedged request) and the
+first good answer wins. Errors fail over to the next provider immediately.
+"""
+import asyncio
+import random
+import time
+from collections import deque
+
+from utils.metrics import REGISTRY, Counter, Histogram
+
+LLM_CALLS = REGISTRY.register(Counter(
+    "skillsync_llm_calls_total", "LLM provider calls by outcome.", ["provider", "outcome"]))
+LLM_PROVIDER_SECONDS = REGISTRY.register(Histogram(
+    "skillsync_llm_provider_seconds", "Latency of successful LLM provider calls.", ["provider"]))
+LLM_HEDGES = REGISTRY.register(Counter(
+    "skillsync_llm_hedges_total", "Hedged requests, by the provider that was too slow.", ["provider"]))
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class AllProvidersFailed(Exception):
+    def __init__(self, errors):
+        self.errors = errors  # [(provider name, exception), ...]
+        detail = "; ".join(f"{name}: {error!r}" for name, error in errors) or "no provider available"
+        super().__init__(f"All LLM providers failed ({detail})")
+
+
+class CircuitBreaker:
+    """
+    Opens after `failures` consecutive failures and rejects calls for
+    `reset_after` seconds; then lets one probe through (half-open), which
+    closes it on success or re-opens it on failure.
+    """
+
+    def __init__(self, failures=5, reset_after=30.0):
+        self.failures, self.reset_after = failures, reset_after
+        self.consecutive = 0
+        self.opened_at = None
+        self.probing = False
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_after
+
+    def allow(self):
+        if self.opened_at is None:
+            return True
+        if self.is_open or self.probing:
+            return False
+        self.probing = True
+        return True
+
+    def record_success(self):
+        self.consecutive, self.opened_at, self.probing = 0, None, False
+
+    def cancel_probe(self):
+        # A probe that was cancelled (e.g. it lost a hedge) proved nothing either way.
+        self.probing = False
+
+    def record_failure(self):
+        self.consecutive += 1
+        if self.probing or self.consecutive >= self.failures:
+            self.opened_at = time.monotonic()
+        self.probing = False
+
+
+class LatencyWindow:
+    def __init__(self, size=200):
+        self.samples = deque(maxlen=size)
+
+    def add(self, seconds):
+        self.samples.append(seconds)
+
+    def percentile(self, pct, min_samples=20):
+        if len(self.samples) < min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def is_retryable(error):
+    """
+    Timeouts, connection errors, rate limits and 5xx are worth retrying (and
+    count against the provider's health); other 4xx are the request's fault.
+    """
+    import openai
+
+    if isinstance(error, (asyncio.TimeoutError, openai.APIConnectionError, openai.RateLimitError)):
+        return True
+    status = getattr(error, "status_code", None)
+    return status is not None and (status >= 500 or status in (408, 409))
+
+
+class Provider:
+    def __init__(self, name, client, model, timeout=60.0, concurrency=32, max_retries=1,
+                 backoff=0.25, breaker=None):
+        self.name, self.client, self.model = name, client, model
+        self.timeout, self.max_retries, self.backoff = timeout, max_retries, backoff
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.breaker = breaker or CircuitBreaker()
+        # Streams are timed to the first response, which is not comparable
+        # to a whole completion, so they get their own window.
+        self.latency = {False: LatencyWindow(), True: LatencyWindow()}
+
+    async def complete(self, **kwargs):
+        """
+        One chat completion on this provider's model, with a timeout and
+        jittered exponential backoff between retries.
+        """
+        for attempt in range(self.max_retries + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"{self.name} circuit is open")
+            try:
+                response, elapsed = await self._attempt(kwargs)
+            except asyncio.CancelledError:
+                self.breaker.cancel_probe()
+                raise
+            except Exception as e:
+                retryable = is_retryable(e)
+                if retryable:
+                    self.breaker.record_failure()
+                else:
+                    # The provider answered; the request itself was bad.
+                    self.breaker.record_success()
+                outcome = "timeout" if isinstance(e, asyncio.TimeoutError) else "error"
+                LLM_CALLS.inc(provider=self.name, outcome=outcome)
+                if not retryable or attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(random.uniform(0, self.backoff * 2 ** attempt))
+                continue
+            self.breaker.record_success()
+            self.latency[bool(kwargs.get("stream"))].add(elapsed)
+            LLM_CALLS.inc(provider=self.name, outcome="ok")
+            LLM_PROVIDER_SECONDS.observe(elapsed, provider=self.name)
+            return response
+
+    async def _attempt(self, kwargs):
+        # Timed (and timed out) from when a slot is free, not from when the call queued.
+        async with self.semaphore:
+            started = time.perf_counter()
+            response = await asyncio.wait_for(
+                self.client.chat.completions.create(model=self.model, **kwargs), self.timeout)
+            return response, time.perf_counter() - started
+
+
+def _discard(task):
+    """
+    Cancel a losing call; if it already produced a stream, close it.
+    """
+    def close(t):
+        if not t.cancelled() and t.exception() is None:
+            aclose = getattr(t.result(), "close", None)
+            if aclose is not None:
+                asyncio.ensure_future(aclose())
+
+    task.cancel()
+    task.add_done_callback(close)
+
+
+class LLMRouter:
+    def __init__(self, providers, hedge=True, hedge_delay=10.0, hedge_percentile=95):
+        self.providers = list(providers)
+        self.hedge = hedge
+        self.hedge_delay_default = hedge_delay  # used until a provider has enough samples
+        self.hedge_percentile = hedge_percentile
+
+    def hedge_delay(self, provider, stream=False):
+        observed = provider.latency[stream].percentile(self.hedge_percentile)
+        return self.hedge_delay_default if observed is None else observed
+
+    def circuit_states(self):
+        return {provider.name: int(provider.breaker.is_open) for provider in self.providers}
+
+    async def chat(self, **kwargs):
+        """
+        Chat completion from the fastest healthy provider.
+        Returns (response, provider); raises AllProvidersFailed.
+        """
+        queue = [provider for provider in self.providers if not provider.breaker.is_open]
+        stream = bool(kwargs.get("stream"))
+        pending, errors = {}, []
+
+        def launch():
+            provider = queue.pop(0)
+            pending[asyncio.create_task(provider.complete(**kwargs))] = provider
+            return provider
+
+        if not queue:
+            raise AllProvidersFailed([(p.name, CircuitOpenError("circuit open")) for p in self.providers])
+        latest = launch()
+        try:
+            while pending:
+                timeout = self.hedge_delay(latest, stream) if self.hedge and queue else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    LLM_HEDGES.inc(provider=latest.name)
+                    latest = launch()
+                    continue
+                for task in done:
+                    provider = pending.pop(task)
+                    if task.exception() is None:
+                        for other in done - {task}:
+                            _discard(other)
+                        return task.result(), provider
+                    errors.append((provider.name, task.exception()))
+                if not pending and queue:
+                    latest = launch()
+            raise AllProvidersFailed(errors)
+        finally:
+            for task in pending:
+                _discard(task)
+
+
+def build_router(settings):
+    """
+    Providers from settings, in LLM_PROVIDERS order; any without an API key
+    is skipped. Each gets a pooled AsyncOpenAI client with the SDK's own
+    retries turned off (the provider retries, so it can fail over instead).
+    """
+    import httpx
+    from openai import AsyncOpenAI
+
+    specs = {
+        "openai": dict(api_key=settings.openai_api_key, base_url=settings.openai_base_url,
+                       model=settings.analysis_model, timeout=settings.llm_timeout,
+                       concurrency=settings.openai_concurrency),
+        "groq": dict(api_key=settings.groq_api_key, base_url=settings.groq_base_url,
+                     model=settings.groq_model, timeout=settings.groq_timeout,
+                     concurrency=settings.groq_concurrency),
+    }
+    providers = []
+    for name in (n.strip() for n in settings.llm_providers.split(",") if n.strip()):
+        spec = specs.get(name)
+        if spec is None:
+            raise ValueError(f"Unknown LLM provider {name!r}; expected one of {', '.join(specs)}")
+        if not spec["api_key"]:
+            continue
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=settings.http_max_connections,
+                                max_keepalive_connections=settings.http_max_connections),
+            timeout=httpx.Timeout(spec["timeout"], connect=5.0),
+        )
+        client = AsyncOpenAI(api_key=spec["api_key"], base_url=spec["base_url"],
+                             http_client=http_client, max_retries=0)
+        providers.append(Provider(
+            name, client, spec["model"], timeout=spec["timeout"], concurrency=spec["concurrency"],
+            max_retries=settings.llm_max_retries,
+            breaker=CircuitBreaker(settings.llm_breaker_failures, settings.llm_breaker_reset),
+        ))
+    return LLMRouter(providers, hedge=settings.llm_hedge, hedge_delay=settings.llm_hedge_delay)
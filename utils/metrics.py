@@ -0,0 +1,168 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from config.config import get_settings
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+def _labels_text(names, values):
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{v}"' for n, v in zip(names, values)) + "}"
+
+
+class Counter:
+    def __init__(self, name, help, labelnames=()):
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(map(labels.get, self.labelnames))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels_text(self.labelnames, key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name, self.help, self.labelnames = name, help, tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}  # labels -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(map(labels.get, self.labelnames))
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                cumulative += count
+                labels = _labels_text(self.labelnames + ("le",), key + (bound,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _labels_text(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {series[-1]}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Gauges:
+    """
+    Values read from a callback at scrape time (e.g. cache counters that
+    already live on another object).
+    """
+
+    def __init__(self, name, help, labelname, read):
+        self.name, self.help, self.labelname, self.read = name, help, labelname, read
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        for label, value in sorted(self.read().items()):
+            lines.append(f'{self.name}{{{self.labelname}="{label}"}} {value}')
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        return "\n".join(line for metric in self.metrics for line in metric.render()) + "\n"
+
+
+REGISTRY = Registry()
+REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "skillsync_request_seconds", "End-to-end request latency.", ["route", "status"]))
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "skillsync_stage_seconds", "Latency of each pipeline stage.", ["stage"]))
+LLM_TOKENS = REGISTRY.register(Counter(
+    "skillsync_llm_tokens_total", "Tokens reported by the LLM API.", ["model", "kind"]))
+PAYLOAD_BYTES = REGISTRY.register(Histogram(
+    "skillsync_payload_bytes", "Size of uploads, prompts and completions.", ["kind"], buckets=SIZE_BUCKETS))
+
+_trace = ContextVar("skillsync_trace", default=None)
+
+
+@contextmanager
+def stage(name):
+    """
+    Time a block of the pipeline: recorded in STAGE_SECONDS and, when a
+    request trace is active, in that request's Server-Timing header.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_SECONDS.observe(elapsed, stage=name)
+        trace = _trace.get()
+        if trace is not None:
+            trace.append((name, elapsed))
+
+
+def record_usage(model, usage):
+    if usage is not None:
+        LLM_TOKENS.inc(usage.prompt_tokens or 0, model=model, kind="prompt")
+        LLM_TOKENS.inc(usage.completion_tokens or 0, model=model, kind="completion")
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware: times every HTTP request and, with SERVER_TIMING=1,
+    adds the stages recorded so far as a Server-Timing response header.
+    """
+
+    def __init__(self, app, server_timing=None):
+        self.app = app
+        self.server_timing = get_settings().server_timing if server_timing is None else server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        trace = []
+        token = _trace.set(trace)
+        start = time.perf_counter()
+        status = "500"
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+                if self.server_timing:
+                    total = (time.perf_counter() - start) * 1000
+                    value = ", ".join(
+                        [f"{name};dur={seconds * 1000:.1f}" for name, seconds in trace] + [f"total;dur={total:.1f}"]
+                    )
+                    message.setdefault("headers", [])
+                    message["headers"] = list(message["headers"]) + [(b"server-timing", value.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _trace.reset(token)
+            route = scope.get("route")
+            REQUEST_SECONDS.observe(time.perf_counter() - start,
+                                    route=getattr(route, "path", "unmatched"), status=status)
@@ -1,11 +1,121 @@
-import PyPDF2
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from io import BytesIO
+import PyPDF2
+from config.config import get_settings
+
+# Limits left at this default come from settings when the call runs (in the
+# worker process for pooled extraction), so importing the module reads nothing.
+FROM_SETTINGS = object()
+
+
+class PDFLimitError(ValueError):
+    """The upload is over a configured size limit."""
+
 
-def extract_text_from_pdf(file_bytes):
+class PDFTimeoutError(TimeoutError):
+    """Text extraction did not finish within the time limit."""
+
+
+def _limits(max_pages, max_bytes):
+    settings = get_settings()
+    return (settings.max_pdf_pages if max_pages is FROM_SETTINGS else max_pages,
+            settings.max_pdf_bytes if max_bytes is FROM_SETTINGS else max_bytes)
+
+
+def iter_pdf_pages(file_bytes, max_pages=FROM_SETTINGS, max_bytes=FROM_SETTINGS):
+    """
+    Yield the text of each page in order, parsing lazily, up to `max_pages`.
+    None disables a limit.
+    """
+    max_pages, max_bytes = _limits(max_pages, max_bytes)
+    if max_bytes is not None and len(file_bytes) > max_bytes:
+        raise PDFLimitError(f"PDF is {len(file_bytes)} bytes; the limit is {max_bytes}.")
     pdf_reader = PyPDF2.PdfReader(BytesIO(file_bytes))
-    text = ""
-    for page in pdf_reader.pages:
-        page_text = page.extract_text()
+    for index, page in enumerate(pdf_reader.pages):
+        if max_pages is not None and index >= max_pages:
+            return
+        yield page.extract_text() or ""
+
+
+def extract_text_from_pdf(file_bytes, max_chars=None, max_pages=FROM_SETTINGS, max_bytes=FROM_SETTINGS):
+    """
+    Page text joined with newlines. Stops parsing as soon as `max_chars`
+    characters have been collected, so the remaining pages are never touched.
+    """
+    parts = []
+    size = 0
+    for page_text in iter_pdf_pages(file_bytes, max_pages=max_pages, max_bytes=max_bytes):
         if page_text:
-            text += page_text + "\n"
-    return text
+            parts.append(page_text + "\n")
+            size += len(page_text) + 1
+        if max_chars is not None and size >= max_chars:
+            break
+    text = "".join(parts)
+    return text[:max_chars] if max_chars is not None else text
+
+
+def _worker_ready():
+    return True
+
+
+class PDFWorkerPool:
+    """
+    Runs extract_text_from_pdf in worker processes with a per-file timeout.
+
+    A malformed PDF that hangs the parser cannot be interrupted inside a
+    worker, so on timeout the whole pool is torn down (workers killed) and
+    replaced. Other files caught in the torn-down pool are retried once.
+    """
+
+    def __init__(self, workers=2, timeout=None):
+        self.workers = workers
+        self.timeout = get_settings().pdf_timeout if timeout is None else timeout
+        self.semaphore = asyncio.Semaphore(workers)
+        self._pool = self._new_pool()
+
+    def _new_pool(self):
+        # "spawn" keeps the workers from inheriting the event loop and client sockets.
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def _recycle(self, pool):
+        if pool is not self._pool:
+            return
+        self._pool = self._new_pool()
+        for process in list((pool._processes or {}).values()):
+            process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    async def extract(self, file_bytes, **kwargs):
+        _, max_bytes = _limits(None, kwargs.get("max_bytes", FROM_SETTINGS))
+        if max_bytes is not None and len(file_bytes) > max_bytes:
+            # Reject before paying to pickle the upload over to a worker.
+            raise PDFLimitError(f"PDF is {len(file_bytes)} bytes; the limit is {max_bytes}.")
+        async with self.semaphore:
+            for attempt in range(2):
+                pool = self._pool
+                future = asyncio.get_running_loop().run_in_executor(
+                    pool, partial(extract_text_from_pdf, file_bytes, **kwargs)
+                )
+                try:
+                    return await asyncio.wait_for(future, self.timeout)
+                except asyncio.TimeoutError:
+                    self._recycle(pool)
+                    raise PDFTimeoutError(f"PDF text extraction took longer than {self.timeout}s.")
+                except BrokenProcessPool:
+                    self._recycle(pool)
+                    if attempt:
+                        raise
+
+    async def start(self):
+        """
+        Spawn every worker process now instead of on the first upload.
+        """
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _worker_ready) for _ in range(self.workers)))
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True, cancel_futures=True)
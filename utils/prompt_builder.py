@@ -0,0 +1,207 @@
+"""
+Token-budgeted prompt inputs.
+
+Instead of cutting the resume at a fixed character offset (which drops the
+end of a long resume and still pays for whitespace and page furniture), the
+text is cleaned up line by line, each line is scored against the JD, and the
+best lines are packed into a per-model token budget. The kept lines are
+emitted in their original reading order.
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from config.config import get_settings
+from utils.skill_matcher import get_skill_matcher
+
+# Models tiktoken does not know (e.g. Groq-hosted Llama) are counted with this.
+DEFAULT_ENCODING = "o200k_base"
+CHARS_PER_TOKEN = 4  # estimate used when no tokenizer is available
+HEADER_LINES = 3  # name / title / contact lines before the first heading, always kept
+MAX_UNIT_CHARS = 400  # longer lines (PDFs without line breaks) are split into sentences
+
+SECTION_WEIGHTS = {
+    "skills": 1.5, "experience": 1.3, "projects": 1.1, "summary": 1.0,
+    "certifications": 0.8, "education": 0.6, None: 0.8,
+}
+_SECTION_NAMES = {
+    "experience": "experience", "work experience": "experience", "professional experience": "experience",
+    "employment history": "experience", "work history": "experience",
+    "skills": "skills", "technical skills": "skills", "core skills": "skills", "key skills": "skills",
+    "core competencies": "skills",
+    "projects": "projects", "key projects": "projects",
+    "summary": "summary", "profile": "summary", "professional summary": "summary", "objective": "summary",
+    "education": "education",
+    "certifications": "certifications", "certificates": "certifications", "licenses": "certifications",
+    "achievements": "projects", "awards": "certifications", "publications": "projects",
+}
+_HEADING = re.compile(r"^(%s)\s*:?$" % "|".join(sorted(_SECTION_NAMES, key=len, reverse=True)), re.IGNORECASE)
+_BULLET = re.compile(r"^[-–—•*▪◦●·]+\s*")
+_NOISE = re.compile(r"^(?:page\s*\d+(?:\s*(?:of|/)\s*\d+)?|\d{1,2}|[\W_]+)$", re.IGNORECASE)
+_WORD = re.compile(r"[a-z][a-z0-9+#.]*[a-z0-9+#]|[a-z]")
+_STOPWORDS = frozenset(
+    "and the for with you our are will have has that this from your who can all any into not but "
+    "about their they them was were been being its also other such than then more most work team "
+    "role job years year experience strong ability skills using used use well including".split()
+)
+
+PromptInputs = namedtuple("PromptInputs", ["resume_text", "jd_text", "resume_tokens", "jd_tokens"])
+PackedJD = namedtuple("PackedJD", ["text", "tokens", "skills", "keywords"])
+_Unit = namedtuple("_Unit", ["index", "heading", "parent", "tokens", "score"])
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model):
+    """
+    The tiktoken encoding for `model`, or None when tiktoken or its BPE file
+    (downloaded and cached on first use) is unavailable.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        print(f"Tokenizer for {model} unavailable ({e!r}); estimating tokens from text length.")
+        return None
+
+
+def count_tokens(text, model):
+    encoding = get_encoding(model)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text, budget, model):
+    encoding = get_encoding(model)
+    if encoding is None:
+        return text[:budget * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    return text if len(tokens) <= budget else encoding.decode(tokens[:budget])
+
+
+def normalize_lines(text):
+    """
+    Non-empty lines with whitespace collapsed and bullets unified to "- ".
+    Page numbers and separator rules are dropped, and lines repeated
+    anywhere in the text (running headers, a skills list pasted twice)
+    are kept only the first time; lines over MAX_UNIT_CHARS are split into
+    sentences before that check.
+    """
+    lines, seen = [], set()
+    for raw in text.splitlines():
+        line = " ".join(raw.split())
+        if not line or _NOISE.match(line):
+            continue
+        bullet = _BULLET.match(line)
+        if bullet:
+            line = "- " + line[bullet.end():]
+        # Long paragraphs are split into sentences first so that a sentence
+        # repeated inside them (boilerplate, "Equal opportunity employer.")
+        # is deduplicated like any other line.
+        units = re.split(r"(?<=[.;!?])\s+", line) if len(line) > MAX_UNIT_CHARS else [line]
+        for unit in units:
+            key = " ".join(re.findall(r"\w+", unit.lower()))
+            if not unit or key in seen:
+                continue
+            seen.add(key)
+            lines.append(unit)
+    return lines
+
+
+def _keywords(text):
+    return {word for word in _WORD.findall(text.lower()) if len(word) > 2 and word not in _STOPWORDS}
+
+
+def _score(line, section, jd_skills, jd_keywords):
+    skills = set(get_skill_matcher().extract(line))
+    words = _keywords(line)
+    relevance = (
+        3.0 * len(skills & jd_skills)
+        + 0.5 * len(skills - jd_skills)
+        + len(words & jd_keywords) / max(1.0, len(words) ** 0.5)
+    )
+    return SECTION_WEIGHTS.get(section, 1.0) * relevance
+
+
+def pack_lines(lines, budget, model, jd_skills=frozenset(), jd_keywords=frozenset(), header_lines=0):
+    """
+    Keep the most relevant `lines` that fit in `budget` tokens, in their
+    original order. A kept line brings its section heading, and a kept
+    bullet brings the line it hangs off (job title, company, dates).
+    """
+    costs = [count_tokens(line, model) + 1 for line in lines]  # +1 for the newline
+    if sum(costs) <= budget:
+        return "\n".join(lines), sum(costs)
+
+    units, pinned = [], []
+    heading, section, parent = None, None, None
+    for index, line in enumerate(lines):
+        match = _HEADING.match(line)
+        if match:
+            heading, section, parent = index, _SECTION_NAMES[match.group(1).lower()], None
+            continue
+        if heading is None and len(pinned) < header_lines:
+            pinned.append(index)
+            continue
+        is_bullet = line.startswith("- ")
+        units.append(_Unit(index, heading, parent if is_bullet else None, costs[index],
+                           _score(line, section, jd_skills, jd_keywords)))
+        if not is_bullet:
+            parent = index
+
+    kept = set()
+    used = 0
+    for index in pinned:
+        if used + costs[index] <= budget:
+            kept.add(index)
+            used += costs[index]
+    # Best relevance per token first; ties go to the earlier (usually more recent) line.
+    for unit in sorted(units, key=lambda u: (-u.score / u.tokens, u.index)):
+        extra = [i for i in (unit.heading, unit.parent) if i is not None and i not in kept]
+        cost = unit.tokens + sum(costs[i] for i in extra)
+        if used + cost > budget:
+            continue
+        kept.update(extra)
+        kept.add(unit.index)
+        used += cost
+    return "\n".join(lines[i] for i in sorted(kept)), used
+
+
+def pack_jd(jd_text, model, budget=None):
+    """
+    The JD side of the prompt, packed once: its text and token count, plus
+    the skills and keywords resumes are ranked against. A batch screening
+    many resumes against one JD reuses the result for every resume.
+    """
+    budget = get_settings().jd_token_budget if budget is None else budget
+    jd_lines = normalize_lines(jd_text)
+    jd_skills = get_skill_matcher().extract(jd_text)
+    # A JD arrives as a few long paragraphs or many short lines; either way the
+    # lines naming skills are kept ahead of company blurb and legal boilerplate.
+    packed, tokens = pack_lines(jd_lines, budget, model, set(jd_skills), _keywords(jd_text))
+    if jd_lines and not packed:
+        packed = truncate_tokens("\n".join(jd_lines), budget, model)
+        tokens = count_tokens(packed, model)
+    return PackedJD(packed, tokens, jd_skills, frozenset(_keywords(packed)))
+
+
+def pack_prompt_inputs(resume_text, jd, model, resume_budget=None, jd_budget=None):
+    """
+    Resume and JD text for the analysis prompt, each packed into its token
+    budget (defaults from settings) and counted with `model`'s tokenizer.
+    `jd` is the JD text or a PackedJD from pack_jd().
+    """
+    if not isinstance(jd, PackedJD):
+        jd = pack_jd(jd, model, jd_budget)
+    resume_budget = get_settings().resume_token_budget if resume_budget is None else resume_budget
+    packed_resume, resume_tokens = pack_lines(
+        normalize_lines(resume_text), resume_budget, model,
+        set(jd.skills), jd.keywords, header_lines=HEADER_LINES,
+    )
+    return PromptInputs(packed_resume, jd.text, resume_tokens, jd.tokens)
@@ -1,26 +1,57 @@
-import os
-from dotenv import load_dotenv
-import chromadb
-from chromadb.utils import embedding_functions
+from utils.vector_store import get_collection
 
-load_dotenv()
-api_key = os.getenv("OPENAI_API_KEY")
 
-if not api_key:
-    raise RuntimeError("OPENAI_API_KEY not set in .env")
+def _build_where(domain=None, role=None):
+    """
+    Chroma metadata filter from the seeded `domain`/`role` fields.
+    """
+    clauses = [{key: value} for key, value in (("domain", domain), ("role", role)) if value]
+    if not clauses:
+        return None
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
 
-openai_ef = embedding_functions.OpenAIEmbeddingFunction(api_key=api_key)
-chroma_client = chromadb.Client()
-collection = chroma_client.get_or_create_collection("resume_bullets", embedding_function=openai_ef)
 
-def get_rag_examples(skills):
+def query_rag_examples(skills, k=1, domain=None, role=None, max_distance=None, collection=None):
+    """
+    Batched lookup: every skill is embedded in a single call and Chroma is
+    queried once for all of them.
+    Returns {skill: [{"bullet", "distance", "skill", "domain", "role"}, ...]},
+    closest first. Hits farther than `max_distance` are dropped.
+    """
+    skills = list(dict.fromkeys(s for s in skills if s))
+    if not skills:
+        return {}
+    if collection is None:
+        collection = get_collection()
+    query = collection.query(
+        query_texts=skills,
+        n_results=k,
+        where=_build_where(domain, role),
+        include=["documents", "metadatas", "distances"],
+    )
     results = {}
-    for skill in skills:
-        try:
-            query = collection.query(query_texts=[skill], n_results=1)
-            bullets = query['documents'][0] if query['documents'] else []
-            if bullets:
-                results[skill] = bullets[0]
-        except Exception as e:
-            results[skill] = f"(No example found: {e})"
+    for skill, docs, metas, dists in zip(skills, query["documents"], query["metadatas"], query["distances"]):
+        hits = []
+        for doc, meta, dist in zip(docs, metas, dists):
+            if max_distance is not None and dist > max_distance:
+                continue
+            meta = meta or {}
+            hits.append({"bullet": doc, "distance": dist,
+                         "skill": meta.get("skill"), "domain": meta.get("domain"), "role": meta.get("role")})
+        results[skill] = hits
     return results
+
+
+def get_rag_examples(skills, domain=None, role=None, max_distance=None, collection=None):
+    """
+    Best example bullet per skill, for skills with a close enough match.
+    Skills without one (or every skill, if the lookup fails) are left out.
+    """
+    try:
+        matches = query_rag_examples(
+            skills, k=1, domain=domain, role=role, max_distance=max_distance, collection=collection
+        )
+    except Exception as e:
+        print(f"RAG lookup failed: {e!r}")
+        return {}
+    return {skill: hits[0]["bullet"] for skill, hits in matches.items() if hits}
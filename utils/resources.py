@@ -0,0 +1,136 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config.config import get_settings
+
+
+class ResourceRegistry:
+    """
+    Lazily built, per-process shared resources (clients, pools, caches).
+
+    Nothing is created until first use, so importing the app is cheap and
+    does not need API keys. Entries are keyed to the process that built
+    them: after a fork (e.g. gunicorn --preload) the child transparently
+    builds its own instead of reusing the parent's sockets, threads and
+    SQLite handles.
+    """
+
+    def __init__(self):
+        self._pid = os.getpid()
+        self._items = {}
+        self._lock = threading.RLock()
+
+    def _check_fork(self):
+        if os.getpid() != self._pid:
+            self._pid = os.getpid()
+            self._items = {}
+            self._lock = threading.RLock()
+
+    def get(self, name, factory):
+        self._check_fork()
+        item = self._items.get(name)
+        if item is None:
+            with self._lock:
+                item = self._items.get(name)
+                if item is None:
+                    item = self._items[name] = factory()
+        return item
+
+    def peek(self, name):
+        """The resource if it has already been built in this process, else None."""
+        self._check_fork()
+        return self._items.get(name)
+
+    def pop(self, name):
+        self._check_fork()
+        return self._items.pop(name, None)
+
+
+RESOURCES = ResourceRegistry()
+
+
+def get_llm_router():
+    """
+    LLMRouter over every configured provider, each with its own pooled
+    AsyncOpenAI client (see utils.llm_router).
+    """
+    def build():
+        from utils.llm_router import build_router
+
+        return build_router(get_settings().require("openai_api_key"))
+
+    return RESOURCES.get("llm_router", build)
+
+
+def get_sync_llm_client():
+    def build():
+        import openai
+
+        settings = get_settings().require("openai_api_key")
+        return openai.OpenAI(api_key=settings.openai_api_key, timeout=settings.llm_timeout)
+
+    return RESOURCES.get("sync_llm_client", build)
+
+
+def get_pdf_workers():
+    def build():
+        from utils.pdf_parser import PDFWorkerPool
+
+        settings = get_settings()
+        return PDFWorkerPool(workers=settings.pdf_concurrency, timeout=settings.pdf_timeout)
+
+    return RESOURCES.get("pdf_workers", build)
+
+
+def get_rag_pool():
+    return RESOURCES.get(
+        "rag_pool",
+        lambda: ThreadPoolExecutor(max_workers=get_settings().rag_concurrency, thread_name_prefix="rag"),
+    )
+
+
+def get_batch_jobs():
+    def build():
+        from utils.batch_jobs import JobStore
+
+        settings = get_settings()
+        return JobStore(path=settings.batch_job_path if settings.batch_job_backend == "sqlite" else None)
+
+    return RESOURCES.get("batch_jobs", build)
+
+
+def get_result_cache():
+    def build():
+        from utils.result_cache import MemoryBackend, ResultCache, SQLiteBackend
+
+        settings = get_settings()
+        if settings.result_cache_backend == "sqlite":
+            backend = SQLiteBackend(settings.result_cache_path, settings.result_cache_max_entries)
+        else:
+            backend = MemoryBackend(settings.result_cache_max_entries)
+        return ResultCache(backend, ttl=settings.result_cache_ttl)
+
+    return RESOURCES.get("result_cache", build)
+
+
+async def aclose_resources():
+    """
+    Release everything this process built (used on app shutdown).
+    """
+    router = RESOURCES.pop("llm_router")
+    if router is not None:
+        for provider in router.providers:
+            await provider.client.close()
+    pool = RESOURCES.pop("rag_pool")
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+    workers = RESOURCES.pop("pdf_workers")
+    if workers is not None:
+        workers.shutdown()
+    jobs = RESOURCES.pop("batch_jobs")
+    if jobs is not None:
+        jobs.close()
+    cache = RESOURCES.pop("result_cache")
+    if cache is not None:
+        cache.close()
@@ -0,0 +1,201 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+def make_cache_key(resume_bytes, jd_text, model, prompt_version):
+    """
+    Content hash of everything that determines an analysis result.
+    The JD is whitespace-normalized so re-pasted copies still hit.
+    """
+    digest = hashlib.sha256()
+    for part in (hashlib.sha256(resume_bytes).digest(), " ".join(jd_text.split()).encode("utf-8"),
+                 model.encode("utf-8"), str(prompt_version).encode("utf-8")):
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class MemoryBackend:
+    """
+    In-process LRU of JSON payloads with a per-entry expiry.
+    """
+
+    blocking = False
+
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        payload, cost, expires_at = entry
+        if expires_at < time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload, cost
+
+    def set(self, key, payload, cost, ttl):
+        self._entries[key] = (payload, cost, time.time() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteBackend:
+    """
+    Same contract as MemoryBackend, persisted to a local SQLite file so
+    results survive restarts and are shared by workers on one host. Every
+    call touches disk, so ResultCache runs them off the event loop.
+    """
+
+    blocking = True
+
+    def __init__(self, path, max_entries=10000):
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+            "cost REAL NOT NULL, expires_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results(last_used)")
+        self._db.commit()
+        self._count = self._count_rows()
+
+    def _count_rows(self):
+        return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT payload, cost, expires_at FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            payload, cost, expires_at = row
+            if expires_at < now:
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._count -= 1
+            else:
+                self._db.execute("UPDATE results SET last_used = ? WHERE key = ?", (now, key))
+            self._db.commit()
+        return (payload, cost) if expires_at >= now else None
+
+    def set(self, key, payload, cost, ttl):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, payload, cost, expires_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, payload, cost, now + ttl, now),
+            )
+            self._db.execute("DELETE FROM results WHERE expires_at < ?", (now,))
+            self._db.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._db.commit()
+            self._count = self._count_rows()
+
+    def __len__(self):
+        # Kept up to date by get/set so that stats and metrics scrapes never
+        # wait on the database from the event loop.
+        return self._count
+
+
+class ResultCache:
+    """
+    TTL result cache with single-flight de-duplication: concurrent calls for
+    the same key share one in-flight computation instead of each paying for
+    an upstream LLM call.
+    """
+
+    def __init__(self, backend, ttl=86400):
+        self.backend = backend
+        self.ttl = ttl
+        self._inflight = {}
+        # One thread, so backend calls stay serialized in submission order.
+        self._executor = (ThreadPoolExecutor(max_workers=1, thread_name_prefix="result-cache")
+                          if getattr(backend, "blocking", False) else None)
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "saved_latency_s": 0.0}
+
+    async def _call(self, fn, *args):
+        if self._executor is None:
+            return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def get(self, key):
+        """
+        Cached value for `key`, or None. Counts as a hit when found.
+        """
+        cached = await self._call(self.backend.get, key)
+        if cached is None:
+            return None
+        payload, cost = cached
+        self.stats["hits"] += 1
+        self.stats["saved_latency_s"] += cost
+        return json.loads(payload)
+
+    async def get_or_compute(self, key, compute, should_cache=lambda value: True):
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+
+        if key in self._inflight:
+            self.stats["coalesced"] += 1
+            started, task = self._inflight[key]
+            value = await asyncio.shield(task)
+            self.stats["saved_latency_s"] += time.perf_counter() - started
+            return json.loads(json.dumps(value))
+
+        self.stats["misses"] += 1
+        started = time.perf_counter()
+
+        async def compute_and_store():
+            value = await compute()
+            if should_cache(value):
+                try:
+                    await self.put(key, value, time.perf_counter() - started)
+                except Exception as e:
+                    print(f"Result cache write failed: {e!r}")
+            return value
+
+        # The computation runs as its own task, so a disconnecting client does
+        # not cancel it for the other waiters (and the result still gets cached).
+        # It leaves _inflight only once stored, so no caller misses both.
+        task = asyncio.ensure_future(compute_and_store())
+        self._inflight[key] = (started, task)
+        task.add_done_callback(lambda done: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def put(self, key, value, cost):
+        """
+        Store a result computed outside get_or_compute (e.g. a streamed one).
+        """
+        await self._call(self.backend.set, key, json.dumps(value), cost, self.ttl)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def snapshot(self):
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["coalesced"]
+        served = self.stats["hits"] + self.stats["coalesced"]
+        return {
+            **self.stats,
+            "hit_ratio": served / lookups if lookups else 0.0,
+            "entries": len(self.backend),
+        }
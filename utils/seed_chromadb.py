@@ -1,21 +1,25 @@
+"""
+Incremental seeder for the persistent `resume_bullets` collection.
+
+Rows are {"bullet", "skill", "domain", "role"} records, read from the
+built-in EXAMPLES below or from a JSONL/CSV corpus. Each row's ID is a hash
+of its bullet text and a second hash of the whole row is stored in its
+metadata, so re-runs only embed and upsert rows that are new or changed.
+A checkpoint file records progress so an interrupted run resumes where it
+stopped.
+
+    python -m utils.seed_chromadb                       # built-in examples
+    python -m utils.seed_chromadb --corpus bullets.jsonl --batch-size 512
+"""
+import argparse
+import csv
+import hashlib
+import json
 import os
-from dotenv import load_dotenv
-import chromadb
-from chromadb.utils import embedding_functions
-
-load_dotenv()
-api_key = os.getenv("OPENAI_API_KEY")
-if not api_key:
-    raise RuntimeError("OPENAI_API_KEY not set in .env")
-
-openai_ef = embedding_functions.OpenAIEmbeddingFunction(api_key=api_key)
-client = chromadb.Client()
-collection = client.get_or_create_collection(
-    "resume_bullets",
-    embedding_function=openai_ef
-)
-
-examples = [
+
+from utils.vector_store import get_collection
+
+EXAMPLES = [
     # ==== IT: Frontend Developer ====
     {"bullet": "Built responsive web applications using React, achieving 99% Lighthouse score.", "skill": "react", "domain": "it", "role": "frontend developer"},
     {"bullet": "Implemented Redux state management for a large-scale e-commerce platform.", "skill": "redux", "domain": "it", "role": "frontend developer"},
@@ -118,13 +122,148 @@ examples = [
     # ==== More domains? Just add here! ====
 ]
 
-documents = [ex["bullet"] for ex in examples]
-metadatas = [{"skill": ex["skill"], "domain": ex["domain"], "role": ex["role"]} for ex in examples]
-ids = [str(i) for i in range(1, len(examples) + 1)]
+FIELDS = ("bullet", "skill", "domain", "role")
+
+
+def clean_row(row):
+    """
+    The row with every field as stripped text; ValueError names what is wrong.
+    """
+    if not isinstance(row, dict):
+        raise ValueError("not an object")
+    missing = [field for field in FIELDS if not isinstance(row.get(field), str) or not row[field].strip()]
+    if missing:
+        raise ValueError(f"missing or empty {', '.join(missing)}")
+    return {field: row[field].strip() for field in FIELDS}
+
+
+def iter_corpus(path, invalid=None):
+    """
+    Yield rows from a .jsonl or .csv file with bullet/skill/domain/role columns.
+    Rows that cannot be parsed or lack a field are skipped; their
+    (line number, reason) pairs are appended to `invalid` when given.
+    """
+    invalid = [] if invalid is None else invalid
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".csv"):
+            reader = csv.DictReader(f)
+            records = ((reader.line_num, row) for row in reader)
+        else:
+            records = ((number, line) for number, line in enumerate(f, 1) if line.strip())
+        for number, record in records:
+            try:
+                yield clean_row(record if isinstance(record, dict) else json.loads(record))
+            except ValueError as e:  # json.JSONDecodeError included
+                invalid.append((number, str(e)))
+
+
+def row_id(row):
+    return hashlib.sha256(row["bullet"].strip().encode("utf-8")).hexdigest()[:32]
+
+
+def row_hash(row):
+    payload = "\0".join(str(row.get(field, "")).strip() for field in FIELDS)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _load_checkpoint(path, source):
+    if not path or not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        state = json.load(f)
+    return state["rows"] if state.get("source") == source else 0
+
+
+def _save_checkpoint(path, source, rows):
+    if not path:
+        return
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"source": source, "rows": rows}, f)
+    os.replace(tmp, path)
+
+
+def _upsert_batch(collection, batch):
+    # Last occurrence wins when the same bullet appears twice in one batch.
+    rows = {row_id(row): row for row in batch}
+    ids = list(rows)
+    existing = collection.get(ids=ids, include=["metadatas"])
+    known = {i: (meta or {}).get("row_hash") for i, meta in zip(existing["ids"], existing["metadatas"])}
+    changed = [i for i in ids if known.get(i) != row_hash(rows[i])]
+    if changed:
+        collection.upsert(
+            ids=changed,
+            documents=[rows[i]["bullet"].strip() for i in changed],
+            metadatas=[
+                {"skill": rows[i]["skill"], "domain": rows[i]["domain"], "role": rows[i]["role"],
+                 "row_hash": row_hash(rows[i])}
+                for i in changed
+            ],
+        )
+    return len(changed)
+
+
+def seed(rows, collection, batch_size=256, checkpoint_path=None, source=None):
+    """
+    Upsert new or changed rows in batches. Returns counts of rows read,
+    upserted and skipped (unchanged, or already covered by the checkpoint).
+    """
+    done = _load_checkpoint(checkpoint_path, source)
+    stats = {"rows": 0, "upserted": 0, "skipped": 0}
+    batch = []
+
+    def flush():
+        upserted = _upsert_batch(collection, batch)
+        stats["upserted"] += upserted
+        stats["skipped"] += len(batch) - upserted
+        _save_checkpoint(checkpoint_path, source, stats["rows"])
+        batch.clear()
+
+    for index, row in enumerate(rows):
+        stats["rows"] += 1
+        if index < done:
+            stats["skipped"] += 1
+            continue
+        batch.append(row)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    return stats
+
+
+def _source_key(path):
+    st = os.stat(path)
+    return f"{os.path.abspath(path)}:{st.st_size}:{int(st.st_mtime)}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed the resume_bullets collection.")
+    parser.add_argument("--corpus", help="JSONL or CSV file of bullet/skill/domain/role rows")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--checkpoint", default="cache/seed_checkpoint.json")
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and rescan every row")
+    args = parser.parse_args()
+
+    collection = get_collection()
+    if args.restart and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+    os.makedirs(os.path.dirname(os.path.abspath(args.checkpoint)), exist_ok=True)
+    invalid = []
+    if args.corpus:
+        rows, source = iter_corpus(args.corpus, invalid), _source_key(args.corpus)
+    else:
+        rows = EXAMPLES
+        source = "builtin:" + hashlib.sha256(json.dumps(EXAMPLES, sort_keys=True).encode()).hexdigest()[:16]
+    stats = seed(rows, collection, batch_size=args.batch_size, checkpoint_path=args.checkpoint, source=source)
+    print(
+        f"Seeded ChromaDB: {stats['upserted']} new or changed resume bullets, "
+        f"{stats['skipped']} unchanged ({collection.count()} total)."
+    )
+    if invalid:
+        lines = ", ".join(str(number) for number, _ in invalid[:20]) + (", ..." if len(invalid) > 20 else "")
+        print(f"Skipped {len(invalid)} invalid rows (lines {lines}); first problem: {invalid[0][1]}.")
+
 
-collection.add(
-    documents=documents,
-    metadatas=metadatas,
-    ids=ids
-)
-print(f"Seeded ChromaDB with {len(documents)} resume bullets across IT, Healthcare, Design, Engineering, and many more!")
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,21 @@
-import os
-import openai
+import json
 import re
-from dotenv import load_dotenv
+from collections import namedtuple
+from config.config import get_settings
+from utils.resources import RESOURCES, get_sync_llm_client
 
-# ===== 1. Securely load API keys =====
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+# ===== 1. API keys and clients =====
+# Settings come from config.config and the OpenAI client from the shared
+# resource registry; both are only touched when an LLM call is made.
 
-if not OPENAI_API_KEY:
-    raise RuntimeError("OPENAI_API_KEY not set in .env")
-
-# ===== 2. OpenAI and Groq clients =====
-openai_client = openai.OpenAI(api_key=OPENAI_API_KEY, base_url="https://api.openai.com/v1")
-# groq_client = openai.OpenAI(api_key=GROQ_API_KEY, base_url="https://api.groq.com/openai/v1") # Enable if you use Groq
-
-# ===== 3. LLM & Rule-Based Extraction =====
+# ===== 2. LLM & Rule-Based Extraction =====
 # You can extend SKILL_DB over time for rule-based fallback:
 SKILL_DB = [
     # IT/Tech
     "python", "machine learning", "data analysis", "sql", "excel", "communication",
     "leadership", "project management", "aws", "azure", "docker", "linux", "javascript",
     "react", "vue.js", "node.js", "devops", "security", "ux design", "wordpress", "graphql",
+    "kubernetes", "ci/cd",
     # Healthcare
     "surgical assistance", "emergency care", "ehr", "scheduling",
     # Textile/Leather/Petroleum
@@ -33,6 +27,113 @@ SKILL_DB = [
     # Expand for your domains!
 ]
 
+# Synonyms, abbreviations and spelling variants -> canonical SKILL_DB entry.
+SKILL_ALIASES = {
+    "k8s": "kubernetes", "kube": "kubernetes",
+    "js": "javascript", "ecmascript": "javascript",
+    "reactjs": "react", "react.js": "react",
+    "vue": "vue.js", "vuejs": "vue.js",
+    "node": "node.js", "nodejs": "node.js",
+    "ml": "machine learning",
+    "amazon web services": "aws", "microsoft azure": "azure",
+    "ms excel": "excel", "microsoft excel": "excel",
+    "ux": "ux design", "user experience design": "ux design",
+    "continuous integration": "ci/cd", "ci cd": "ci/cd",
+    "electronic health records": "ehr", "emr": "ehr",
+    "customer relationship management": "crm",
+    "pmp": "project management",
+}
+
+SkillMatch = namedtuple("SkillMatch", ["skill", "start", "end", "text"])
+
+
+def _normalize_term(term):
+    return " ".join(term.lower().split())
+
+
+class SkillMatcher:
+    """
+    Finds every taxonomy term in a text with one precompiled regex.
+
+    The pattern is an alternation built from a character trie of all skills
+    and aliases, so shared prefixes are factored out and the longest term
+    wins. Matches must sit on word boundaries, and any run of whitespace
+    inside a multi-word term matches (PDF text often wraps mid-phrase).
+    """
+
+    def __init__(self, terms, pattern=None):
+        # terms: normalized surface form -> canonical skill
+        self.terms = terms
+        self.pattern = pattern or self._build_pattern(terms)
+        self._regex = re.compile(self.pattern, re.IGNORECASE)
+
+    @classmethod
+    def from_taxonomy(cls, skills, aliases=None):
+        terms = {_normalize_term(skill): _normalize_term(skill) for skill in skills}
+        for alias, canonical in (aliases or {}).items():
+            terms[_normalize_term(alias)] = _normalize_term(canonical)
+        return cls(terms)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["terms"], pattern=data["pattern"])
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"terms": self.terms, "pattern": self.pattern}, f)
+
+    @staticmethod
+    def _build_pattern(terms):
+        trie = {}
+        for term in terms:
+            node = trie
+            for ch in term:
+                node = node.setdefault(ch, {})
+            node[""] = True
+
+        def to_regex(node):
+            branches = [
+                (r"\s+" if ch == " " else re.escape(ch)) + to_regex(child)
+                for ch, child in sorted(node.items()) if ch
+            ]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            # A term that is also a prefix of longer terms: try the longer ones first.
+            return f"(?:{body})?" if "" in node else body
+
+        return r"(?<!\w)(?:" + (to_regex(trie) or "(?!)") + r")(?!\w)"
+
+    def find(self, text):
+        """
+        Every taxonomy match in `text` as SkillMatch(skill, start, end, text).
+        """
+        return [
+            SkillMatch(self.terms[_normalize_term(m.group())], m.start(), m.end(), m.group())
+            for m in self._regex.finditer(text)
+        ]
+
+    def extract(self, text):
+        """
+        Canonical skills found in `text`, in order of first appearance.
+        """
+        return list(dict.fromkeys(match.skill for match in self.find(text)))
+
+
+def get_skill_matcher():
+    """
+    The shared SkillMatcher: the SKILL_TAXONOMY_PATH file if set, else the
+    built-in SKILL_DB. Compiling a large taxonomy takes seconds, so it is
+    built on first use (or during warm-up), once per process.
+    """
+    def build():
+        path = get_settings().skill_taxonomy_path
+        return SkillMatcher.load(path) if path else SkillMatcher.from_taxonomy(SKILL_DB, SKILL_ALIASES)
+
+    return RESOURCES.get("skill_matcher", build)
+
 def extract_skills(text, use_llm=True):
     """
     Hybrid: LLM first, fallback to keywords.
@@ -46,7 +147,7 @@ def extract_skills(text, use_llm=True):
             f"Text: {text[:2500]}"
         )
         try:
-            result = openai_client.chat.completions.create(
+            result = get_sync_llm_client().chat.completions.create(
                 model="gpt-4o",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0,
@@ -59,12 +160,7 @@ def extract_skills(text, use_llm=True):
             print(f"LLM skill extraction failed: {e}. Falling back to rule-based.")
 
     # Rule-based fallback
-    text = text.lower()
-    found = []
-    for skill in SKILL_DB:
-        if re.search(rf"\b{re.escape(skill)}\b", text):
-            found.append(skill)
-    return list(set(found))
+    return get_skill_matcher().extract(text)
 
 def match_skills(jd_skills, resume_skills):
     """
@@ -94,9 +190,12 @@ def get_structured_resume_feedback(resume_text, jd_text):
         '"improvement_suggestions": [{"skill": "", "suggestion": ""}], '
         '"formatting_feedback": "", "overall_score": 0, "summary": "", "personalized_roadmap": []}'
     )
-    user_prompt = f"Resume:\n{resume_text[:3500]}\n\nJob Description:\n{jd_text[:2000]}"
+    # Imported here: the prompt builder ranks lines with this module's skill matcher.
+    from utils.prompt_builder import pack_prompt_inputs
+    inputs = pack_prompt_inputs(resume_text, jd_text, "gpt-4o")
+    user_prompt = f"Resume:\n{inputs.resume_text}\n\nJob Description:\n{inputs.jd_text}"
     try:
-        result = openai_client.chat.completions.create(
+        result = get_sync_llm_client().chat.completions.create(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -0,0 +1,73 @@
+from config.config import get_settings
+from utils.resources import RESOURCES
+
+COLLECTION_NAME = "resume_bullets"
+CANDIDATE_COLLECTION = "candidates"
+
+
+def get_embedding_function():
+    """
+    Cached OpenAI embedding function, built on first use.
+    """
+    def build():
+        from chromadb.utils import embedding_functions
+        from utils.embedding_cache import CachedEmbeddingFunction
+
+        settings = get_settings().require("openai_api_key")
+        upstream = embedding_functions.OpenAIEmbeddingFunction(
+            # The key is read from the environment by name, so the collection
+            # config Chroma persists names the variable instead of holding the key.
+            api_key_env_var="OPENAI_API_KEY", model_name=settings.embedding_model,
+        )
+        # Chroma builds the client with the SDK defaults (600s timeout, 2 retries).
+        upstream.client = upstream.client.with_options(
+            timeout=settings.embedding_timeout, max_retries=settings.embedding_max_retries
+        )
+        return CachedEmbeddingFunction(
+            upstream,
+            model_name=settings.embedding_model,
+            path=settings.embedding_cache_path,
+        )
+
+    return RESOURCES.get("embedding_function", build)
+
+
+def get_chroma_client():
+    """
+    On-disk store shared by the API and the seeder, so seeded rows survive restarts.
+    """
+    def build():
+        import chromadb
+
+        return chromadb.PersistentClient(path=get_settings().chroma_path)
+
+    return RESOURCES.get("chroma_client", build)
+
+
+def get_collection(name=COLLECTION_NAME, space=None):
+    """
+    `space` ("l2", "cosine", "ip") only applies when the collection is created.
+    """
+    return RESOURCES.get(
+        f"collection:{name}",
+        lambda: get_chroma_client().get_or_create_collection(
+            name, embedding_function=get_embedding_function(),
+            configuration={"hnsw": {"space": space}} if space else None,
+        ),
+    )
+
+
+def get_candidate_index():
+    """
+    Analyzed resumes for /search: vectors in Chroma, skills in SQLite.
+    """
+    def build():
+        from utils.candidate_index import CandidateIndex, SkillIndex
+
+        return CandidateIndex(
+            get_collection(CANDIDATE_COLLECTION, space="cosine"),
+            SkillIndex(get_settings().candidate_skills_path),
+            get_embedding_function(),
+        )
+
+    return RESOURCES.get("candidate_index", build)